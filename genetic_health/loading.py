@@ -6,7 +6,11 @@ from pathlib import Path
 
 from .config import DATA_DIR
 
-_VALID_BASES = frozenset("ACGT")
+_VALID_BASES = "ACGT"
+# Every valid 1-2 base genotype, so validation is a single set lookup
+_VALID_GENOTYPES = frozenset(
+    list(_VALID_BASES) + [a + b for a in _VALID_BASES for b in _VALID_BASES]
+)
 
 
 def _load_position_to_rsid_map():
@@ -18,8 +22,7 @@ def _load_position_to_rsid_map():
     lookup_path = DATA_DIR / "rsid_positions_grch37.json"
     if not lookup_path.exists():
         return {}
-    with open(lookup_path, 'r') as f:
-        rsid_to_pos = json.load(f)
+    rsid_to_pos = json.loads(lookup_path.read_bytes())
     pos_to_rsid = {}
     for rsid, info in rsid_to_pos.items():
         key = f"{info['chrom']}:{info['pos']}"
@@ -54,7 +57,7 @@ def load_genome(genome_path: Path) -> tuple:
                 if genotype == '--':
                     continue
                 # Validate genotype: must be 1-2 valid bases
-                if not (1 <= len(genotype) <= 2 and all(b in _VALID_BASES for b in genotype)):
+                if genotype not in _VALID_GENOTYPES:
                     skipped += 1
                     continue
 
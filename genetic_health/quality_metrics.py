@@ -55,6 +55,10 @@ def compute_quality_metrics(genome_by_rsid, genome_path=None):
         try:
             with open(genome_path, "r") as fh:
                 for line in fh:
+                    # Cheap C-level gate: a no-call row must contain "\t--",
+                    # so most rows are skipped without stripping or splitting
+                    if "\t--" not in line:
+                        continue
                     line = line.strip()
                     if not line or line.startswith("#"):
                         continue
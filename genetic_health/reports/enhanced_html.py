@@ -16,11 +16,16 @@ Output: reports/GENETIC_HEALTH_REPORT.html
 import html as html_mod
 import json
 import math
+import os
+import re
 import sys
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
+from string import Formatter
 
+from ..clinical_context import PATHWAYS
 from ..config import REPORTS_DIR
 
 
@@ -57,6 +62,13 @@ def _esc(text):
     return html_mod.escape(str(text)) if text else ""
 
 
+# ClinVar condition segments that carry no information
+_GENERIC_CONDITIONS = frozenset({"not provided", "not specified", "unknown", "see cases"})
+
+
+# ClinVar trait strings and priority 'why' texts repeat across the overview,
+# doctor card and wrapper sections, so the cleaners are cached per input.
+@lru_cache(maxsize=4096)
 def _clean_condition(raw):
     """Clean ClinVar pipe-separated condition text into readable form.
 
@@ -65,27 +77,33 @@ def _clean_condition(raw):
     """
     if not raw:
         return "Unknown"
-    # Split on pipe and semicolons, filter out junk
-    parts = []
-    for segment in raw.replace("|", ";").split(";"):
-        segment = segment.strip()
-        if not segment:
-            continue
-        low = segment.lower()
-        # Skip generic/unhelpful segments
-        if low in ("not provided", "not specified", "unknown", "see cases"):
-            continue
-        if low.endswith("-related disorder") and len(parts) > 0:
-            continue  # Skip generic "GENE-related disorder" if we have a real name
-        parts.append(segment)
-    if not parts:
-        return raw.split("|")[0].split(";")[0].strip()
-    # Pick the most readable one (prefer longer, lowercase-ish names over ALL CAPS)
-    best = parts[0]
-    for p in parts:
-        if not p.isupper() and len(p) > len(best) // 2:
-            best = p
-            break
+    if "|" not in raw and ";" not in raw:
+        # Single condition name: nothing to split or choose between
+        best = raw.strip()
+        if not best.isupper() or best.lower() in _GENERIC_CONDITIONS:
+            return best
+    else:
+        # Split on pipe and semicolons, filter out junk
+        parts = []
+        for segment in raw.replace("|", ";").split(";"):
+            segment = segment.strip()
+            if not segment:
+                continue
+            low = segment.lower()
+            # Skip generic/unhelpful segments
+            if low in _GENERIC_CONDITIONS:
+                continue
+            if low.endswith("-related disorder") and len(parts) > 0:
+                continue  # Skip generic "GENE-related disorder" if we have a real name
+            parts.append(segment)
+        if not parts:
+            return raw.partition("|")[0].partition(";")[0].strip()
+        # Pick the most readable one (prefer longer, lowercase-ish names over ALL CAPS)
+        best = parts[0]
+        for p in parts:
+            if not p.isupper() and len(p) > len(best) // 2:
+                best = p
+                break
     # Clean ALL CAPS into title case
     if best.isupper():
         best = best.replace(",", ", ").title()
@@ -111,6 +129,7 @@ def _dedup_phrases(text):
     return "; ".join(unique)
 
 
+@lru_cache(maxsize=4096)
 def _clean_why(text):
     """Clean pipe-separated ClinVar text from 'why' fields and deduplicate."""
     if not text:
@@ -120,6 +139,12 @@ def _clean_why(text):
     return _dedup_phrases(text)
 
 
+@lru_cache(maxsize=4096)
+def _humanize(key):
+    """Turn a snake_case status or key into a Title Case label."""
+    return key.replace("_", " ").title()
+
+
 # =============================================================================
 # PAPER REFERENCES — curated, hardcoded
 # =============================================================================
@@ -208,31 +233,57 @@ PAPER_REFS = {
 # DATABASE LINK BUILDER
 # =============================================================================
 
+# (URL prefix, closing markup) per external database; the rsID goes between
+_DB_LINK_PARTS = (
+    ("https://www.ncbi.nlm.nih.gov/snp/", '" target="_blank" rel="noopener">dbSNP</a>'),
+    ("https://www.ncbi.nlm.nih.gov/clinvar/?term=", '" target="_blank" rel="noopener">ClinVar</a>'),
+    ("https://www.snpedia.com/index.php/", '" target="_blank" rel="noopener">SNPedia</a>'),
+    ("https://www.pharmgkb.org/search?query=", '" target="_blank" rel="noopener">PharmGKB</a>'),
+)
+
+
+# The same rsID is rendered in several sections (findings, references), so
+# the link markup is cached per rsID.
+@lru_cache(maxsize=4096)
 def db_links_html(rsid):
     """Generate HTML links to external databases for a given rsID."""
     if not rsid or not rsid.startswith("rs"):
         return ""
-    links = [
-        f'<a href="https://www.ncbi.nlm.nih.gov/snp/{rsid}" target="_blank" rel="noopener">dbSNP</a>',
-        f'<a href="https://www.ncbi.nlm.nih.gov/clinvar/?term={rsid}" target="_blank" rel="noopener">ClinVar</a>',
-        f'<a href="https://www.snpedia.com/index.php/{rsid}" target="_blank" rel="noopener">SNPedia</a>',
-        f'<a href="https://www.pharmgkb.org/search?query={rsid}" target="_blank" rel="noopener">PharmGKB</a>',
-    ]
-    return '<span class="db-links">' + " &middot; ".join(links) + "</span>"
+    links = " &middot; ".join('<a href="' + base + rsid + tail for base, tail in _DB_LINK_PARTS)
+    return '<span class="db-links">' + links + "</span>"
+
+
+# PAPER_REFS is static, so each rsID's reference block is rendered once at import
+_PAPER_REFS_HTML = {
+    rsid: '<div class="paper-refs">References: ' + " | ".join(
+        f'<a href="https://pubmed.ncbi.nlm.nih.gov/{r["pmid"]}/" '
+        f'target="_blank" rel="noopener">{r["title"]} ({r["year"]})</a>'
+        for r in refs
+    ) + "</div>"
+    for rsid, refs in PAPER_REFS.items() if refs
+}
+
+
+def _key_papers_html():
+    """Every curated paper as an <li>, deduplicated by PMID (first occurrence wins)."""
+    unique_refs = {}
+    for refs in PAPER_REFS.values():
+        for r in refs:
+            unique_refs.setdefault(r["pmid"], r)
+    return "\n".join(
+        f'<li><a href="https://pubmed.ncbi.nlm.nih.gov/{r["pmid"]}/" '
+        f'target="_blank" rel="noopener">{r["title"]}</a> '
+        f'(PMID: {r["pmid"]}, {r["year"]})</li>'
+        for r in unique_refs.values()
+    )
+
+
+_KEY_PAPERS_HTML = _key_papers_html()
 
 
 def paper_refs_html(rsid):
     """Generate HTML for paper references for a given rsID."""
-    refs = PAPER_REFS.get(rsid, [])
-    if not refs:
-        return ""
-    items = []
-    for r in refs:
-        items.append(
-            f'<a href="https://pubmed.ncbi.nlm.nih.gov/{r["pmid"]}/" '
-            f'target="_blank" rel="noopener">{r["title"]} ({r["year"]})</a>'
-        )
-    return '<div class="paper-refs">References: ' + " | ".join(items) + "</div>"
+    return _PAPER_REFS_HTML.get(rsid, "")
 
 
 # =============================================================================
@@ -242,8 +293,8 @@ def paper_refs_html(rsid):
 def load_json(path):
     if not path.exists():
         return {}
-    with open(path, "r") as f:
-        return json.load(f)
+    # One bytes read; json.loads detects the UTF encoding itself
+    return json.loads(path.read_bytes())
 
 
 # =============================================================================
@@ -252,10 +303,9 @@ def load_json(path):
 
 def svg_impact_bar(findings):
     """Horizontal bar chart: impact distribution."""
-    high = sum(1 for f in findings if f.get("magnitude", 0) >= 3)
-    mod = sum(1 for f in findings if f.get("magnitude", 0) == 2)
-    low = sum(1 for f in findings if f.get("magnitude", 0) == 1)
-    info = sum(1 for f in findings if f.get("magnitude", 0) == 0)
+    by_mag = Counter(f.get("magnitude", 0) for f in findings)
+    high = sum(n for mag, n in by_mag.items() if mag >= 3)
+    mod, low, info = by_mag[2], by_mag[1], by_mag[0]
 
     max_val = max(high, mod, low, info, 1)
     bar_w = 280
@@ -283,11 +333,37 @@ def svg_impact_bar(findings):
     )
 
 
+def _unit(angle):
+    """(cos, sin) of an angle given in degrees."""
+    rad = math.radians(angle)
+    return math.cos(rad), math.sin(rad)
+
+
+def _donut_slice(cx, cy, r, inner_r, start, end, sweep, color):
+    """SVG <path> for one donut slice between the unit vectors `start` and `end`.
+
+    Consecutive slices share an edge, so callers pass the previous slice's
+    `end` as the next `start` and only one new angle is evaluated per slice.
+    """
+    cos1, sin1 = start
+    cos2, sin2 = end
+    # Whole viewBox units are well below a pixel at chart size and keep the
+    # path data short; shared edges round identically, so slices stay flush
+    ix1, iy1 = round(cx + inner_r * cos1), round(cy + inner_r * sin1)
+    large = 1 if sweep > 180 else 0
+    return (
+        f'<path d="M {ix1} {iy1} '
+        f'L {round(cx + r * cos1)} {round(cy + r * sin1)} '
+        f'A {r} {r} 0 {large} 1 {round(cx + r * cos2)} {round(cy + r * sin2)} '
+        f'L {round(cx + inner_r * cos2)} {round(cy + inner_r * sin2)} '
+        f'A {inner_r} {inner_r} 0 {large} 0 {ix1} {iy1} Z" '
+        f'fill="{color}" opacity="0.85"/>'
+    )
+
+
 def svg_category_donut(findings):
     """Donut chart: findings by category."""
-    counts = defaultdict(int)
-    for f in findings:
-        counts[f.get("category", "Other")] += 1
+    counts = Counter(f.get("category", "Other") for f in findings)
 
     if not counts:
         return ""
@@ -297,34 +373,17 @@ def svg_category_donut(findings):
     cx, cy, r = 120, 120, 90
     inner_r = 55
     angle = -90
+    start = _unit(angle)
     paths = []
     legend_items = []
 
     for idx, (cat, cnt) in enumerate(sorted(counts.items(), key=lambda x: -x[1])):
         color = colors[idx % len(colors)]
         sweep = cnt / total * 360
-        start_rad = math.radians(angle)
-        end_rad = math.radians(angle + sweep)
-
-        x1 = cx + r * math.cos(start_rad)
-        y1 = cy + r * math.sin(start_rad)
-        x2 = cx + r * math.cos(end_rad)
-        y2 = cy + r * math.sin(end_rad)
-        ix1 = cx + inner_r * math.cos(start_rad)
-        iy1 = cy + inner_r * math.sin(start_rad)
-        ix2 = cx + inner_r * math.cos(end_rad)
-        iy2 = cy + inner_r * math.sin(end_rad)
-
-        large = 1 if sweep > 180 else 0
-        d = (
-            f"M {ix1:.1f} {iy1:.1f} "
-            f"L {x1:.1f} {y1:.1f} "
-            f"A {r} {r} 0 {large} 1 {x2:.1f} {y2:.1f} "
-            f"L {ix2:.1f} {iy2:.1f} "
-            f"A {inner_r} {inner_r} 0 {large} 0 {ix1:.1f} {iy1:.1f} Z"
-        )
-        paths.append(f'<path d="{d}" fill="{color}" opacity="0.85"/>')
+        end = _unit(angle + sweep)
+        paths.append(_donut_slice(cx, cy, r, inner_r, start, end, sweep, color))
         angle += sweep
+        start = end
 
         ly = 15 + idx * 22
         legend_items.append(
@@ -349,35 +408,46 @@ def svg_category_donut(findings):
     )
 
 
+# Metabolism gauge geometry: the background arc is fixed, only the pointer moves
+_METAB_CX, _METAB_CY, _METAB_R = 70, 65, 50
+_METAB_START, _METAB_END = 150, 30  # degrees
+
+
+def _metab_arc():
+    cx, cy, r = _METAB_CX, _METAB_CY, _METAB_R
+    s_rad = math.radians(_METAB_START)
+    e_rad = math.radians(_METAB_END)
+    sx = cx + r * math.cos(s_rad)
+    sy = cy - r * math.sin(s_rad)
+    ex = cx + r * math.cos(e_rad)
+    ey = cy - r * math.sin(e_rad)
+    return (
+        f'<path d="M {sx:.1f} {sy:.1f} A {r} {r} 0 0 1 {ex:.1f} {ey:.1f}" '
+        f'fill="none" stroke="var(--border)" stroke-width="8" stroke-linecap="round"/>'
+    )
+
+
+_METAB_ARC = _metab_arc()
+_SPEED_LABELS = {0: "Slow", 1: "Intermediate", 2: "Fast"}
+
+
 def svg_metabolism_gauge(label, level, color):
     """Simple gauge for drug metabolism speed. level: 0-2 (slow/intermediate/fast)."""
-    cx, cy, r = 70, 65, 50
-    start_math = 150
-    end_math = 30
-    range_math = start_math - end_math
+    cx, cy, r = _METAB_CX, _METAB_CY, _METAB_R
 
-    ptr_math = start_math - (level / 2) * range_math
+    ptr_math = _METAB_START - (level / 2) * (_METAB_START - _METAB_END)
     ptr_rad = math.radians(ptr_math)
     ptr_r = r - 10
     px = cx + ptr_r * math.cos(ptr_rad)
     py = cy - ptr_r * math.sin(ptr_rad)
 
-    s_rad = math.radians(start_math)
-    e_rad = math.radians(end_math)
-    sx = cx + r * math.cos(s_rad)
-    sy = cy - r * math.sin(s_rad)
-    ex = cx + r * math.cos(e_rad)
-    ey = cy - r * math.sin(e_rad)
-
-    speed_labels = {0: "Slow", 1: "Intermediate", 2: "Fast"}
-    speed_text = speed_labels.get(level, "Unknown")
+    speed_text = _SPEED_LABELS.get(level, "Unknown")
 
     return (
         f'<svg viewBox="0 0 140 100" class="gauge" role="img" '
         f'aria-label="{label} metabolism gauge">'
         f'<title>{label}: {speed_text}</title>'
-        f'<path d="M {sx:.1f} {sy:.1f} A {r} {r} 0 0 1 {ex:.1f} {ey:.1f}" '
-        f'fill="none" stroke="var(--border)" stroke-width="8" stroke-linecap="round"/>'
+        f'{_METAB_ARC}'
         f'<circle cx="{px:.1f}" cy="{py:.1f}" r="6" fill="{color}"/>'
         f'<text x="15" y="78" fill="currentColor" font-size="8">Slow</text>'
         f'<text x="108" y="78" fill="currentColor" font-size="8">Fast</text>'
@@ -420,7 +490,7 @@ def svg_risk_heatmap(prs_results):
             f'<rect x="{x}" y="{y}" width="{cell_w}" height="{cell_h}" rx="4" '
             f'fill="{color}" opacity="0.8"/>'
             f'<text x="{x + cell_w//2}" y="{y + 24}" text-anchor="middle" '
-            f'fill="#fff" font-size="9" font-weight="bold">{name}</text>'
+            f'fill="#fff" font-size="9" font-weight="bold">{_esc(name)}</text>'
             f'<text x="{x + cell_w//2}" y="{y + 42}" text-anchor="middle" '
             f'fill="#fff" font-size="14" font-weight="bold">{r["percentile"]:.0f}%</text>'
         )
@@ -433,55 +503,43 @@ def svg_risk_heatmap(prs_results):
     )
 
 
-def svg_ancestry_donut(ancestry_results):
-    """Donut chart showing ancestry proportions."""
+# Superpopulation codes shared by the ancestry donut and ancestry table
+_ANCESTRY_LABELS = {"EUR": "European", "AFR": "African", "EAS": "East Asian",
+                    "SAS": "South Asian", "AMR": "Admixed American"}
+_ANCESTRY_COLORS = {"EUR": C["eur"], "AFR": C["afr"], "EAS": C["eas"],
+                    "SAS": C["sas"], "AMR": C["amr"]}
+
+
+def svg_ancestry_donut(ancestry_results, sorted_pops=None):
+    """Donut chart showing ancestry proportions.
+
+    sorted_pops: optional (pop, proportion) items already sorted largest first.
+    """
     if not ancestry_results or not ancestry_results.get("proportions"):
         return ""
 
-    proportions = ancestry_results["proportions"]
-    colors = {"EUR": C["eur"], "AFR": C["afr"], "EAS": C["eas"],
-              "SAS": C["sas"], "AMR": C["amr"]}
-    labels = {"EUR": "European", "AFR": "African", "EAS": "East Asian",
-              "SAS": "South Asian", "AMR": "Admixed American"}
-
     cx, cy, r = 110, 110, 85
     inner_r = 50
     angle = -90
+    start = _unit(angle)
     paths = []
     legend_items = []
 
-    sorted_pops = sorted(proportions.items(), key=lambda x: -x[1])
+    if sorted_pops is None:
+        sorted_pops = sorted(ancestry_results["proportions"].items(), key=lambda x: -x[1])
 
     for idx, (pop, prop) in enumerate(sorted_pops):
         if prop < 0.005:
             continue
-        color = colors.get(pop, C["slate"])
+        color = _ANCESTRY_COLORS.get(pop, C["slate"])
         sweep = prop * 360
-        start_rad = math.radians(angle)
-        end_rad = math.radians(angle + sweep)
-
-        x1 = cx + r * math.cos(start_rad)
-        y1 = cy + r * math.sin(start_rad)
-        x2 = cx + r * math.cos(end_rad)
-        y2 = cy + r * math.sin(end_rad)
-        ix1 = cx + inner_r * math.cos(start_rad)
-        iy1 = cy + inner_r * math.sin(start_rad)
-        ix2 = cx + inner_r * math.cos(end_rad)
-        iy2 = cy + inner_r * math.sin(end_rad)
-
-        large = 1 if sweep > 180 else 0
-        d = (
-            f"M {ix1:.1f} {iy1:.1f} "
-            f"L {x1:.1f} {y1:.1f} "
-            f"A {r} {r} 0 {large} 1 {x2:.1f} {y2:.1f} "
-            f"L {ix2:.1f} {iy2:.1f} "
-            f"A {inner_r} {inner_r} 0 {large} 0 {ix1:.1f} {iy1:.1f} Z"
-        )
-        paths.append(f'<path d="{d}" fill="{color}" opacity="0.85"/>')
+        end = _unit(angle + sweep)
+        paths.append(_donut_slice(cx, cy, r, inner_r, start, end, sweep, color))
         angle += sweep
+        start = end
 
         ly = 10 + idx * 24
-        label = labels.get(pop, pop)
+        label = _ANCESTRY_LABELS.get(pop, pop)
         legend_items.append(
             f'<rect x="240" y="{ly}" width="14" height="14" rx="3" fill="{color}"/>'
             f'<text x="260" y="{ly+12}" fill="currentColor" font-size="12">'
@@ -505,17 +563,18 @@ def svg_ancestry_donut(ancestry_results):
     )
 
 
-def svg_prs_gauge(label, percentile, category):
-    """Semi-circular gauge for PRS percentile with 4 color zones."""
-    cx, cy, r = 80, 70, 55
+# PRS gauge geometry: the four colored zone arcs are fixed, only the pointer moves
+_PRS_CX, _PRS_CY, _PRS_R = 80, 70, 55
+
 
+def _prs_zone_arcs():
+    cx, cy, r = _PRS_CX, _PRS_CY, _PRS_R
     zones = [
         (0.0, 0.2, C["green"]),
         (0.2, 0.8, C["blue"]),
         (0.8, 0.95, C["amber"]),
         (0.95, 1.0, C["red"]),
     ]
-
     zone_paths = []
     for start_frac, end_frac, color in zones:
         a1 = math.radians(180 - start_frac * 180)
@@ -529,6 +588,17 @@ def svg_prs_gauge(label, percentile, category):
             f'<path d="M {x1:.1f} {y1:.1f} A {r} {r} 0 {large} 1 {x2:.1f} {y2:.1f}" '
             f'fill="none" stroke="{color}" stroke-width="10" stroke-linecap="butt"/>'
         )
+    return "".join(zone_paths)
+
+
+_PRS_ZONE_ARCS = _prs_zone_arcs()
+_PRS_CATEGORY_COLORS = {"low": C["green"], "average": C["blue"],
+                        "elevated": C["amber"], "high": C["red"]}
+
+
+def svg_prs_gauge(label, percentile, category):
+    """Semi-circular gauge for PRS percentile with 4 color zones."""
+    cx, cy, r = _PRS_CX, _PRS_CY, _PRS_R
 
     frac = max(0.0, min(1.0, percentile / 100.0))
     ptr_angle = math.radians(180 - frac * 180)
@@ -536,15 +606,13 @@ def svg_prs_gauge(label, percentile, category):
     px = cx + ptr_r * math.cos(ptr_angle)
     py = cy - ptr_r * math.sin(ptr_angle)
 
-    cat_colors = {"low": C["green"], "average": C["blue"],
-                  "elevated": C["amber"], "high": C["red"]}
-    ptr_color = cat_colors.get(category, C["slate"])
+    ptr_color = _PRS_CATEGORY_COLORS.get(category, C["slate"])
 
     return (
         f'<svg viewBox="0 0 160 105" class="prs-gauge" role="img" '
         f'aria-label="{label} PRS gauge">'
         f'<title>{label}: {percentile:.0f}th percentile ({category})</title>'
-        f'{"".join(zone_paths)}'
+        f'{_PRS_ZONE_ARCS}'
         f'<circle cx="{px:.1f}" cy="{py:.1f}" r="6" fill="{ptr_color}"/>'
         f'<text x="{cx}" y="{cy + 5}" text-anchor="middle" fill="currentColor" '
         f'font-size="16" font-weight="bold">{percentile:.0f}%</text>'
@@ -604,6 +672,42 @@ ELI5_CONDITIONS = {
 }
 
 
+# Membership sets shared by several section builders
+_ELEVATED_RISK = frozenset({"elevated", "high"})
+_KEY_NUTRITION_GROUPS = ("methylation", "iron", "caffeine", "nutrition", "vitamin")
+_NUTRITION_GROUPS = ("methylation", "iron_metabolism", "caffeine", "metabolic_diabetes",
+                     "nutrition", "vitamin_d", "iron")
+_NUTRITION_NARRATIVE_IDS = frozenset({"methylation_choline", "vitamin_d_profile",
+                                      "iron_profile", "caffeine_metabolism"})
+
+# Population labels for the per-finding allele frequency line
+_FREQ_LABELS = {"EUR": "European", "AFR": "African",
+                "EAS": "East Asian", "SAS": "South Asian", "AMR": "American"}
+
+# Table row templates for the larger per-variant tables
+_PHARMGKB_ROW = (
+    '<tr><td><strong>{gene}</strong></td>'
+    '<td><code>{rsid}</code> {links}</td>'
+    '<td>{level}</td>'
+    '<td>{drugs}</td>'
+    '<td><code>{genotype}</code></td></tr>'
+)
+_CLINVAR_ROW = (
+    '<tr><td><strong>{gene}</strong></td>'
+    '<td class="desc-trunc" title="{traits}">{condition}</td>'
+    '<td><code>{genotype}</code></td>'
+    '<td>{stars}</td>'
+    '<td>{zygosity}</td></tr>'
+)
+_CLINVAR_TABLE_HEAD = (
+    '<div class="table-scroll"><table><tr><th>Gene</th><th>Condition</th><th>Genotype</th>'
+    '<th>Stars</th><th>Zygosity</th></tr>'
+)
+
+# CSS class suffix indexed by finding magnitude (0-6 scale)
+_MAG_CLASS = ("info", "low", "mod", "high", "high", "high", "high")
+
+
 def _eli5_for_gene(gene):
     """Get a plain-language explanation for a gene."""
     return ELI5_GENES.get(gene, "")
@@ -645,9 +749,9 @@ def build_key_findings(findings, recommendations_data, apoe_data, acmg_data,
         raw = (af.get("traits") or "Unknown")
         condition = _clean_condition(raw)
         eli5 = _eli5_for_gene(gene)
-        text = f'<strong>{gene}</strong>: You carry a variant linked to <em>{condition}</em> that doctors consider medically actionable. You should see a genetic counselor.'
+        text = f'<strong>{_esc(gene)}</strong>: You carry a variant linked to <em>{_esc(condition)}</em> that doctors consider medically actionable. You should see a genetic counselor.'
         if eli5:
-            text += f'<br><span class="eli5-inline">{eli5}</span>'
+            text += f'<br><span class="eli5-inline">{_esc(eli5)}</span>'
         urgent_bullets.append(text)
 
     priorities = (recommendations_data or {}).get("priorities", [])
@@ -656,9 +760,9 @@ def build_key_findings(findings, recommendations_data, apoe_data, acmg_data,
             eli5 = _eli5_for_condition(p.get("id", ""))
             # Clean pipe-separated ClinVar text from recommendation reasons
             why = _clean_why(p["why"])
-            text = f'<strong>{p["title"]}</strong>: {why}'
+            text = f'<strong>{_esc(p["title"])}</strong>: {_esc(why)}'
             if eli5:
-                text += f'<br><span class="eli5-inline">{eli5}</span>'
+                text += f'<br><span class="eli5-inline">{_esc(eli5)}</span>'
             urgent_bullets.append(text)
 
     if urgent_bullets:
@@ -673,28 +777,28 @@ def build_key_findings(findings, recommendations_data, apoe_data, acmg_data,
 
     if apoe_data and apoe_data.get("apoe_type", "Unknown") != "Unknown":
         risk = apoe_data["risk_level"]
-        color = "red" if risk in ("high", "elevated") else "yellow" if risk == "moderate" else "green"
+        color = "red" if risk in _ELEVATED_RISK else "yellow" if risk == "moderate" else "green"
         eli5 = _eli5_for_gene("APOE")
-        text = f'<strong>APOE {apoe_data["apoe_type"]}</strong>: {risk.title()} Alzheimer\'s risk (odds ratio: {apoe_data.get("alzheimer_or", "N/A")}x).'
+        text = f'<strong>APOE {_esc(apoe_data["apoe_type"])}</strong>: {risk.title()} Alzheimer\'s risk (odds ratio: {apoe_data.get("alzheimer_or", "N/A")}x).'
         if eli5:
-            text += f'<br><span class="eli5-inline">{eli5}</span>'
+            text += f'<br><span class="eli5-inline">{_esc(eli5)}</span>'
         risk_bullets.append((color, text))
 
     if prs_results:
         elevated_prs = [(cid, r) for cid, r in prs_results.items()
-                        if r["risk_category"] in ("elevated", "high")]
+                        if r["risk_category"] in _ELEVATED_RISK]
         average_prs = [(cid, r) for cid, r in prs_results.items()
                        if r["risk_category"] == "average"]
         low_prs = [(cid, r) for cid, r in prs_results.items()
                    if r["risk_category"] == "low"]
         for cid, r in elevated_prs:
             risk_bullets.append(("yellow",
-                f'<strong>{r["name"]}</strong>: {r["percentile"]:.0f}th percentile genetic risk — higher than {r["percentile"]:.0f}% of people.'))
+                f'<strong>{_esc(r["name"])}</strong>: {r["percentile"]:.0f}th percentile genetic risk — higher than {r["percentile"]:.0f}% of people.'))
         if average_prs:
-            names = ", ".join(r["name"] for _, r in average_prs)
+            names = ", ".join(_esc(r["name"]) for _, r in average_prs)
             risk_bullets.append(("green", f'Average genetic risk for: {names}.'))
         if low_prs:
-            names = ", ".join(r["name"] for _, r in low_prs)
+            names = ", ".join(_esc(r["name"]) for _, r in low_prs)
             risk_bullets.append(("green", f'<em>Lower</em> than average risk for: {names}.'))
 
     # Pathogenic ClinVar findings count
@@ -725,9 +829,9 @@ def build_key_findings(findings, recommendations_data, apoe_data, acmg_data,
                   if r["phenotype"] == "normal"]
         for gene, r in non_normal:
             eli5 = _eli5_for_gene(gene)
-            text = f'<strong>{gene} ({r["diplotype"]})</strong>: {r["phenotype"].replace("_"," ").title()} Metabolizer — some drugs need dose adjustment.'
+            text = f'<strong>{_esc(gene)} ({_esc(r["diplotype"])})</strong>: {_esc(_humanize(r["phenotype"]))} Metabolizer — some drugs need dose adjustment.'
             if eli5:
-                text += f'<br><span class="eli5-inline">{eli5}</span>'
+                text += f'<br><span class="eli5-inline">{_esc(eli5)}</span>'
             drug_bullets.append(("yellow", text))
         if normal:
             names = ", ".join(g for g, _ in normal)
@@ -746,13 +850,13 @@ def build_key_findings(findings, recommendations_data, apoe_data, acmg_data,
     nutrition_bullets = []
     for p in priorities:
         if p["priority"] in ("high", "moderate") and p["title"] not in urgent_titles:
-            nutrition_groups = {"methylation", "iron", "caffeine", "nutrition", "vitamin"}
-            if any(g in p.get("id", "").lower() for g in nutrition_groups):
+            pid = p.get("id", "").lower()
+            if any(g in pid for g in _KEY_NUTRITION_GROUPS):
                 eli5 = _eli5_for_condition(p.get("id", ""))
                 why = _clean_why(p["why"])
-                text = f'<strong>{p["title"]}</strong>: {why}'
+                text = f'<strong>{_esc(p["title"])}</strong>: {_esc(why)}'
                 if eli5:
-                    text += f'<br><span class="eli5-inline">{eli5}</span>'
+                    text += f'<br><span class="eli5-inline">{_esc(eli5)}</span>'
                 color = "yellow"
                 nutrition_bullets.append((color, text))
 
@@ -777,11 +881,11 @@ def build_key_findings(findings, recommendations_data, apoe_data, acmg_data,
         elevated = [d for d, info in domains.items() if info["risk_level"] == "elevated"]
         low = [d for d, info in domains.items() if info["risk_level"] == "low"]
         if elevated:
-            names = ", ".join(d.replace("_", " ").title() for d in elevated)
+            names = ", ".join(_humanize(d) for d in elevated)
             mh_bullets.append(("yellow",
                 f'Elevated genetic susceptibility for: {names}. Lifestyle and support make a huge difference.'))
         if low:
-            names = ", ".join(d.replace("_", " ").title() for d in low)
+            names = ", ".join(_humanize(d) for d in low)
             mh_bullets.append(("green", f'Low genetic susceptibility for: {names}.'))
         if mental_health_data.get("summary"):
             mh_bullets.append(("yellow" if elevated else "green",
@@ -827,10 +931,10 @@ def build_key_findings(findings, recommendations_data, apoe_data, acmg_data,
     for f in findings:
         if f.get("gene") == "ACTN3":
             eli5 = _eli5_for_gene("ACTN3")
-            status = f.get("status", "").replace("_", " ").title()
+            status = _humanize(f.get("status", ""))
             body_bullets.append(("green",
                 f'<strong>Athletic profile (ACTN3)</strong>: {status}.'
-                f'{" " + eli5 if eli5 else ""}'))
+                f'{" " + _esc(eli5) if eli5 else ""}'))
             break
 
     if ancestry_data and ancestry_data.get("top_ancestry"):
@@ -861,7 +965,7 @@ def build_key_findings(findings, recommendations_data, apoe_data, acmg_data,
             # Clean ClinVar pipe text in descriptions
             desc = _clean_condition(g["description"]) if "|" in g.get("description", "") else g["description"]
             if eli5:
-                desc += f' <span class="eli5-inline">({eli5})</span>'
+                desc += f' <span class="eli5-inline">({_esc(eli5)})</span>'
             parts.append(
                 f'<div class="good-news-card"><strong>{g["gene"]}</strong>: {desc}</div>'
             )
@@ -912,7 +1016,7 @@ def build_action_plan(recommendations_data, insights_data, preventive_care_data=
             )
 
             if eli5:
-                parts.append(f'<p class="eli5">{eli5}</p>')
+                parts.append(f'<p class="eli5">{_esc(eli5)}</p>')
 
             parts.append(f'<p><strong>Why:</strong> {_clean_why(p["why"])}</p>')
 
@@ -939,8 +1043,8 @@ def build_action_plan(recommendations_data, insights_data, preventive_care_data=
                 )
                 for m in p["monitoring"]:
                     parts.append(
-                        f'<tr><td>{m["test"]}</td><td>{m["frequency"]}</td>'
-                        f'<td>{m["reason"]}</td></tr>'
+                        f'<tr><td>{_esc(m["test"])}</td><td>{_esc(m["frequency"])}</td>'
+                        f'<td>{_esc(m["reason"])}</td></tr>'
                     )
                 parts.append("</table>")
 
@@ -982,10 +1086,10 @@ def build_action_plan(recommendations_data, insights_data, preventive_care_data=
             freq = m.get("frequency", "").lower()
             color = next((c for key, c in freq_colors.items() if key in freq), "var(--accent2)")
             parts.append(
-                f'<tr><td><strong>{m["test"]}</strong></td>'
+                f'<tr><td><strong>{_esc(m["test"])}</strong></td>'
                 f'<td><span class="mag-badge" style="background:{color};color:#fff">'
-                f'{m["frequency"]}</span></td>'
-                f'<td>{m["reason"]}</td></tr>'
+                f'{_esc(m["frequency"])}</span></td>'
+                f'<td>{_esc(m["reason"])}</td></tr>'
             )
         parts.append("</table>")
 
@@ -998,9 +1102,9 @@ def build_action_plan(recommendations_data, insights_data, preventive_care_data=
             color = urgency_colors.get(ref.get("urgency", ""), "var(--border)")
             parts.append(
                 f'<div class="finding-card" style="border-left-color:{color}">'
-                f'<strong>{ref["specialist"]}</strong>: {_clean_why(ref["reason"])}'
+                f'<strong>{_esc(ref["specialist"])}</strong>: {_esc(_clean_why(ref["reason"]))}'
                 f' <span class="badge" style="background:{color};color:#fff">'
-                f'{ref.get("urgency", "routine")}</span></div>'
+                f'{_esc(ref.get("urgency", "routine"))}</span></div>'
             )
 
     # Preventive care timeline
@@ -1090,36 +1194,40 @@ def build_drug_guide(star_alleles_data, findings, pharmgkb_findings, polypharmac
         parts.append("</div>")
 
         parts.append(
-            '<table><tr><th>Gene</th><th>Diplotype</th><th>Phenotype</th>'
+            '<div class="table-scroll"><table><tr><th>Gene</th><th>Diplotype</th><th>Phenotype</th>'
             '<th>SNPs</th><th>What This Means</th></tr>'
         )
         for gene, r in star_alleles_data.items():
-            phenotype = r["phenotype"].replace("_", " ").title()
+            phenotype = _humanize(r["phenotype"])
             eli5 = _eli5_for_gene(gene)
-            note = eli5 if eli5 else r["clinical_note"][:120]
+            if eli5:
+                note_cell = f'<td style="font-size:.85em">{_esc(eli5)}</td>'
+            else:
+                # Full clinical note; the browser truncates it with an ellipsis
+                note = _esc(r["clinical_note"])
+                note_cell = f'<td class="desc-trunc" style="font-size:.85em" title="{note}">{note}</td>'
             parts.append(
-                f'<tr><td><strong>{gene}</strong></td>'
-                f'<td><code>{r["diplotype"]}</code></td>'
-                f'<td>{phenotype}</td>'
+                f'<tr><td><strong>{_esc(gene)}</strong></td>'
+                f'<td><code>{_esc(r["diplotype"])}</code></td>'
+                f'<td>{_esc(phenotype)}</td>'
                 f'<td>{r["snps_found"]}/{r["snps_total"]}</td>'
-                f'<td style="font-size:.85em">{note}</td></tr>'
+                f'{note_cell}</tr>'
             )
-        parts.append("</table>")
+        parts.append("</table></div>")
 
     # PharmGKB annotations
     if pharmgkb_findings:
         parts.append("<h3>Drug-Gene Interactions (PharmGKB)</h3>")
-        parts.append('<table><tr><th>Gene</th><th>RSID</th><th>Level</th>'
+        parts.append('<div class="table-scroll"><table><tr><th>Gene</th><th>RSID</th><th>Level</th>'
                      '<th>Drugs</th><th>Genotype</th></tr>')
-        for p in pharmgkb_findings:
-            parts.append(
-                f'<tr><td><strong>{_esc(p["gene"])}</strong></td>'
-                f'<td><code>{_esc(p["rsid"])}</code> {db_links_html(p["rsid"])}</td>'
-                f'<td>{_esc(p["level"])}</td>'
-                f'<td>{_esc(p["drugs"])}</td>'
-                f'<td><code>{_esc(p["genotype"])}</code></td></tr>'
+        parts.append("\n".join(
+            _PHARMGKB_ROW.format(
+                gene=_esc(p["gene"]), rsid=_esc(p["rsid"]), links=db_links_html(p["rsid"]),
+                level=_esc(p["level"]), drugs=_esc(p["drugs"]), genotype=_esc(p["genotype"]),
             )
-        parts.append("</table>")
+            for p in pharmgkb_findings
+        ))
+        parts.append("</table></div>")
 
     # Polypharmacy warnings
     if polypharmacy_data and polypharmacy_data.get("warnings"):
@@ -1202,6 +1310,59 @@ def build_drug_guide(star_alleles_data, findings, pharmgkb_findings, polypharmac
 # SECTION 4: DISEASE RISK OVERVIEW
 # =============================================================================
 
+_CLINVAR_TIERS = (
+    ("pathogenic", "Pathogenic Variants", "red"),
+    ("likely_pathogenic", "Likely Pathogenic Variants", "orange"),
+    ("risk_factor", "Risk Factor Variants", "amber"),
+    ("drug_response", "Drug Response Variants", "blue"),
+)
+
+
+def _clinvar_rows(variants):
+    """Yield a ClinVar table row for each of the first 50 variants."""
+    for v in variants[:50]:
+        stars = v.get("gold_stars", 0)
+        yield _CLINVAR_ROW.format(
+            gene=_esc(v.get("gene", "Unknown")),
+            traits=_esc(v.get("traits", "")),
+            condition=_esc(_clean_condition(v.get("traits") or "Unknown")),
+            genotype=_esc(v.get("user_genotype", "")),
+            stars="&#9733;" * stars + "&#9734;" * (4 - stars),
+            zygosity=_esc(_humanize(v.get("zygosity", ""))),
+        )
+
+
+def _clinvar_table(variants, label, color, show_overflow=True):
+    """Heading and ClinVar table for one significance tier."""
+    if not variants:
+        return ""
+    html = "\n".join((
+        f'<h3>{label} '
+        f'<span class="badge" style="background:{color}">{len(variants)}</span></h3>',
+        _CLINVAR_TABLE_HEAD,
+        *_clinvar_rows(variants),
+        "</table></div>",
+    ))
+    if show_overflow and len(variants) > 50:
+        html += (f'\n<p style="font-size:.85em;color:var(--accent2)">'
+                 f'Showing 50 of {len(variants)} variants.</p>')
+    return html
+
+
+def _protective_grid(protective):
+    """Heading and card grid for protective ClinVar variants."""
+    return "\n".join((
+        f'<h3>Protective Variants '
+        f'<span class="badge" style="background:var(--green)">{len(protective)}</span></h3>',
+        '<div class="good-news-grid">',
+        *(f'<div class="good-news-card">'
+          f'<strong>{_esc(v.get("gene", "Unknown"))}</strong>: '
+          f'{_esc(_clean_condition(v.get("traits") or ""))}</div>'
+          for v in protective),
+        "</div>",
+    ))
+
+
 def build_disease_risk_overview(prs_results, disease_findings_data, acmg_data):
     """Unified disease risk: PRS gauges + ClinVar pathogenic + ACMG flags."""
     parts = []
@@ -1218,7 +1379,24 @@ def build_disease_risk_overview(prs_results, disease_findings_data, acmg_data):
 
     # PRS gauges
     if prs_results:
-        any_non_applicable = any(not r["ancestry_applicable"] for r in prs_results.values())
+        # One pass collects the gauges, table rows and elevated conditions
+        any_non_applicable = False
+        gauges, rows, elevated = [], [], []
+        for r in prs_results.values():
+            if not r["ancestry_applicable"]:
+                any_non_applicable = True
+            short_name = r["name"].replace("Age-Related ", "").replace("Macular Degeneration", "AMD")
+            gauges.append(svg_prs_gauge(_esc(short_name), r["percentile"], r["risk_category"]))
+            rows.append(
+                f'<tr><td><strong>{_esc(r["name"])}</strong></td>'
+                f'<td>{r["percentile"]:.0f}th</td>'
+                f'<td>{r["risk_category"].title()}</td>'
+                f'<td>{r["snps_found"]}/{r["snps_total"]}</td>'
+                f'<td style="font-size:.8em">{_esc(r["reference"])}</td></tr>'
+            )
+            if r["risk_category"] in _ELEVATED_RISK:
+                elevated.append(r)
+
         if any_non_applicable:
             parts.append(
                 '<div class="doctor-callout" style="border-color:var(--warn)">'
@@ -1233,38 +1411,29 @@ def build_disease_risk_overview(prs_results, disease_findings_data, acmg_data):
             'Your combined variant score vs. the general population.</p>'
         )
         parts.append('<div class="gauge-row" style="justify-content:center">')
-        for cid, r in prs_results.items():
-            short_name = r["name"].replace("Age-Related ", "").replace("Macular Degeneration", "AMD")
-            parts.append(svg_prs_gauge(short_name, r["percentile"], r["risk_category"]))
+        parts.extend(gauges)
         parts.append("</div>")
 
-        parts.append('<table class="sortable"><tr><th>Condition</th><th>Percentile</th>'
+        parts.append('<div class="table-scroll"><table class="sortable">'
+                     '<tr><th>Condition</th><th>Percentile</th>'
                      '<th>Category</th><th>SNPs</th><th>Reference</th></tr>')
-        for cid, r in prs_results.items():
-            parts.append(
-                f'<tr><td><strong>{r["name"]}</strong></td>'
-                f'<td>{r["percentile"]:.0f}th</td>'
-                f'<td>{r["risk_category"].title()}</td>'
-                f'<td>{r["snps_found"]}/{r["snps_total"]}</td>'
-                f'<td style="font-size:.8em">{r["reference"]}</td></tr>'
-            )
-        parts.append("</table>")
+        parts.extend(rows)
+        parts.append("</table></div>")
 
-        elevated = [r for r in prs_results.values() if r["risk_category"] in ("elevated", "high")]
         if elevated:
             parts.append("<h3>Elevated Risk Details</h3>")
             for r in elevated:
-                parts.append(f'<details open><summary><strong>{r["name"]}</strong> — '
+                parts.append(f'<details open><summary><strong>{_esc(r["name"])}</strong> — '
                              f'{r["percentile"]:.0f}th percentile ({r["risk_category"]})</summary>')
                 if r["contributing_snps"]:
                     parts.append('<table><tr><th>Gene</th><th>rsID</th><th>Copies</th>'
                                  '<th>Effect</th></tr>')
-                    for s in r["contributing_snps"][:5]:
-                        parts.append(
-                            f'<tr><td>{s["gene"]}</td><td><code>{s["rsid"]}</code> '
-                            f'{db_links_html(s["rsid"])}</td>'
-                            f'<td>{s["copies"]}</td><td>{s["contribution"]:.3f}</td></tr>'
-                        )
+                    parts.append("\n".join(
+                        f'<tr><td>{_esc(s["gene"])}</td><td><code>{_esc(s["rsid"])}</code> '
+                        f'{db_links_html(s["rsid"])}</td>'
+                        f'<td>{s["copies"]}</td><td>{s["contribution"]:.3f}</td></tr>'
+                        for s in r["contributing_snps"][:5]
+                    ))
                     parts.append("</table>")
                 parts.append("</details>")
 
@@ -1288,7 +1457,7 @@ def build_disease_risk_overview(prs_results, disease_findings_data, acmg_data):
                 f'{acmg_data["genes_with_variants"]} ACMG gene(s). '
                 f'Genetic counseling recommended.</div>'
             )
-            parts.append('<table><tr><th>Gene</th><th>Condition</th>'
+            parts.append('<div class="table-scroll"><table><tr><th>Gene</th><th>Condition</th>'
                          '<th>Genotype</th><th>Stars</th><th>Actionability</th></tr>')
             for f in acmg_findings:
                 gene = f.get("gene", "Unknown")
@@ -1298,75 +1467,26 @@ def build_disease_risk_overview(prs_results, disease_findings_data, acmg_data):
                 action = f.get("acmg_actionability", "")
                 eli5 = _eli5_for_gene(gene)
                 parts.append(
-                    f'<tr><td><strong>{gene}</strong>'
-                    f'{"<br><span class=eli5-inline>" + eli5 + "</span>" if eli5 else ""}'
+                    f'<tr><td><strong>{_esc(gene)}</strong>'
+                    f'{"<br><span class=eli5-inline>" + _esc(eli5) + "</span>" if eli5 else ""}'
                     f'</td>'
-                    f'<td>{condition}</td>'
-                    f'<td><code>{genotype}</code></td>'
+                    f'<td>{_esc(condition)}</td>'
+                    f'<td><code>{_esc(genotype)}</code></td>'
                     f'<td>{"&#9733;" * stars}{"&#9734;" * (4 - stars)}</td>'
-                    f'<td style="font-size:.85em">{action}</td></tr>'
+                    f'<td style="font-size:.85em">{_esc(action)}</td></tr>'
                 )
-            parts.append("</table>")
+            parts.append("</table></div>")
 
     # ClinVar disease findings
     if disease_findings_data:
-        def _variant_table(variants, label, color):
-            if not variants:
-                return ""
-            rows = []
-            rows.append(
-                f'<h3>{label} '
-                f'<span class="badge" style="background:{color}">{len(variants)}</span></h3>'
-            )
-            rows.append(
-                '<table><tr><th>Gene</th><th>Condition</th><th>Genotype</th>'
-                '<th>Stars</th><th>Zygosity</th></tr>'
-            )
-            for v in variants[:50]:
-                gene = _esc(v.get("gene", "Unknown"))
-                condition = _esc(_clean_condition(v.get("traits") or "Unknown"))
-                genotype = _esc(v.get("user_genotype", ""))
-                stars = v.get("gold_stars", 0)
-                star_str = "&#9733;" * stars + "&#9734;" * (4 - stars)
-                zyg = _esc(v.get("zygosity", "").replace("_", " ").title())
-                rows.append(
-                    f'<tr><td><strong>{gene}</strong></td>'
-                    f'<td style="max-width:400px;overflow:hidden;text-overflow:ellipsis;white-space:nowrap" '
-                    f'title="{_esc(v.get("traits", ""))}">{condition}</td>'
-                    f'<td><code>{genotype}</code></td>'
-                    f'<td>{star_str}</td>'
-                    f'<td>{zyg}</td></tr>'
-                )
-            rows.append("</table>")
-            if len(variants) > 50:
-                rows.append(f'<p style="font-size:.85em;color:var(--accent2)">'
-                            f'Showing 50 of {len(variants)} variants.</p>')
-            return "\n".join(rows)
-
-        parts.append(_variant_table(
-            disease_findings_data.get("pathogenic", []), "Pathogenic Variants", C["red"]))
-        parts.append(_variant_table(
-            disease_findings_data.get("likely_pathogenic", []), "Likely Pathogenic Variants", C["orange"]))
-        parts.append(_variant_table(
-            disease_findings_data.get("risk_factor", []), "Risk Factor Variants", C["amber"]))
-        parts.append(_variant_table(
-            disease_findings_data.get("drug_response", []), "Drug Response Variants", C["blue"]))
+        parts.extend(
+            _clinvar_table(disease_findings_data.get(key, []), label, C[color])
+            for key, label, color in _CLINVAR_TIERS
+        )
 
         protective = disease_findings_data.get("protective", [])
         if protective:
-            parts.append(
-                f'<h3>Protective Variants '
-                f'<span class="badge" style="background:var(--green)">{len(protective)}</span></h3>'
-            )
-            parts.append('<div class="good-news-grid">')
-            for v in protective:
-                gene = _esc(v.get("gene", "Unknown"))
-                condition = _esc(_clean_condition(v.get("traits") or ""))
-                parts.append(
-                    f'<div class="good-news-card">'
-                    f'<strong>{gene}</strong>: {condition}</div>'
-                )
-            parts.append("</div>")
+            parts.append(_protective_grid(protective))
 
     parts.append(
         '<p style="font-size:.85em;color:var(--accent2)">'
@@ -1411,7 +1531,7 @@ def build_body_profile(traits_data, blood_type_data, sleep_data, longevity_data,
         parts.append('<table><tr><th>Trait</th><th>Prediction</th>'
                      '<th>Confidence</th><th>What It Means</th></tr>')
         for trait_id, trait in traits_data.items():
-            label = trait_labels.get(trait_id, trait_id.replace("_", " ").title())
+            label = trait_labels.get(trait_id, _humanize(trait_id))
             conf_color = {"high": "var(--green)", "moderate": "var(--accent)",
                           "low": "var(--warn)"}.get(trait["confidence"], "inherit")
             parts.append(
@@ -1487,7 +1607,7 @@ def build_body_profile(traits_data, blood_type_data, sleep_data, longevity_data,
                 c = C["green"] if s >= 60 else C["amber"] if s >= 40 else C["red"]
                 parts.append(
                     f'<div style="border:1px solid var(--border);border-radius:8px;padding:1em;text-align:center">'
-                    f'<strong>{_esc(domain.replace("_", " ").title())}</strong><br>'
+                    f'<strong>{_esc(_humanize(domain))}</strong><br>'
                     f'<span style="font-size:1.5em;color:{c}">{s}</span>/90<br>'
                     f'<span style="font-size:.85em;color:var(--accent2)">{info["rating"]}</span>'
                     f'</div>'
@@ -1505,8 +1625,8 @@ def build_body_profile(traits_data, blood_type_data, sleep_data, longevity_data,
         if f.get("gene") == "ACTN3":
             parts.append("<h3>Athletic Profile</h3>")
             eli5 = _eli5_for_gene("ACTN3")
-            parts.append(f'<p class="eli5">{eli5}</p>')
-            status = f.get("status", "").replace("_", " ").title()
+            parts.append(f'<p class="eli5">{_esc(eli5)}</p>')
+            status = _humanize(f.get("status", ""))
             parts.append(f'<p><strong>ACTN3</strong>: {status} — {f.get("description", "")}</p>')
             parts.append(paper_refs_html("rs1815739"))
             break
@@ -1567,7 +1687,7 @@ def build_body_profile(traits_data, blood_type_data, sleep_data, longevity_data,
                 color = {"elevated": C["amber"], "high": C["red"]}.get(level, C["green"])
                 parts.append(
                     f'<p><span class="mag-badge" style="background:{color};color:#fff">'
-                    f'{level.upper()}</span> <strong>{cond.replace("_", " ").title()}</strong>: '
+                    f'{level.upper()}</span> <strong>{_humanize(cond)}</strong>: '
                     f'{_esc(info.get("detail", ""))}</p>'
                 )
 
@@ -1582,7 +1702,7 @@ def build_body_profile(traits_data, blood_type_data, sleep_data, longevity_data,
                 color = {"elevated": C["amber"], "high": C["red"]}.get(level, C["green"])
                 parts.append(
                     f'<p><span class="mag-badge" style="background:{color};color:#fff">'
-                    f'{level.upper()}</span> <strong>{domain.replace("_", " ").title()}</strong></p>'
+                    f'{level.upper()}</span> <strong>{_humanize(domain)}</strong></p>'
                 )
 
     # Hormone metabolism
@@ -1616,7 +1736,7 @@ def build_mental_health_section(data):
             color = level_colors.get(info["risk_level"], "var(--border)")
             parts.append(
                 f'<div style="border:1px solid var(--border);border-radius:8px;padding:1em;text-align:center">'
-                f'<strong>{_esc(domain.replace("_", " ").title())}</strong><br>'
+                f'<strong>{_esc(_humanize(domain))}</strong><br>'
                 f'<span style="font-size:1.3em;color:{color}">{_esc(info["risk_level"].title())}</span>'
                 f'</div>'
             )
@@ -1660,6 +1780,12 @@ def build_mental_health_section(data):
 # SECTION 7: CLINICAL FINDINGS DETAIL
 # =============================================================================
 
+def _finding_badge(f):
+    """Magnitude, its CSS class suffix and the escaped status label of a finding."""
+    mag = f.get("magnitude", 0)
+    return mag, _MAG_CLASS[max(0, min(mag, 6))], _esc(_humanize(f.get("status", "")))
+
+
 def build_clinical_detail(findings, epistasis_results, carrier_screen_data):
     """Full technical findings table + epistasis + carrier screening."""
     parts = []
@@ -1669,15 +1795,17 @@ def build_clinical_detail(findings, epistasis_results, carrier_screen_data):
         'Searchable, sortable, and exportable.</p>'
     )
 
+    # Magnitude, CSS class and status label appear on the cards and in the
+    # pathway list, so derive them once; findings are referenced by index
+    badges = [_finding_badge(f) for f in findings]
+    groups = defaultdict(list)
+    for i, f in enumerate(findings):
+        groups[f.get("category", "Other")].append(i)
+
     # All lifestyle findings grouped by category
-    categories = sorted(set(f.get("category", "Other") for f in findings))
-    for cat in categories:
-        cat_findings = sorted(
-            [f for f in findings if f.get("category") == cat],
-            key=lambda x: -x.get("magnitude", 0),
-        )
-        if not cat_findings:
-            continue
+    for cat in sorted(groups):
+        cat_findings = groups[cat]
+        cat_findings.sort(key=lambda i: -findings[i].get("magnitude", 0))
 
         parts.append(
             f'<details class="category-section" open>'
@@ -1685,17 +1813,21 @@ def build_clinical_detail(findings, epistasis_results, carrier_screen_data):
             f'<span class="badge">{len(cat_findings)}</span></h3></summary>'
         )
 
-        for f in cat_findings:
-            mag = f.get("magnitude", 0)
-            mag_class = "high" if mag >= 3 else "mod" if mag == 2 else "low" if mag == 1 else "info"
+        for i in cat_findings:
+            f = findings[i]
+            mag, mag_class, status = badges[i]
             rsid = _esc(f.get("rsid", ""))
             gene = _esc(f.get("gene", "Unknown"))
             genotype = _esc(f.get("genotype", ""))
-            status = _esc(f.get("status", "").replace("_", " ").title())
             desc = _esc(f.get("description", ""))
             note = _esc(f.get("note", ""))
 
-            parts.append(f'<div class="finding-card {mag_class}">')
+            # data-* fields feed the CSV export without re-parsing the header text
+            parts.append(
+                f'<div class="finding-card {mag_class}" data-gene="{gene}" '
+                f'data-rsid="{rsid}" data-genotype="{genotype}" data-status="{status}" '
+                f'data-category="{_esc(cat)}" data-mag="{mag}">'
+            )
             parts.append(
                 f'<div class="finding-header">'
                 f'<span class="mag-badge mag-{mag_class}">{mag}/6</span> '
@@ -1706,15 +1838,13 @@ def build_clinical_detail(findings, epistasis_results, carrier_screen_data):
             )
             eli5 = _eli5_for_gene(f.get("gene", ""))
             if eli5:
-                parts.append(f'<p class="eli5-inline" style="font-size:.85em;margin:.2em 0">{eli5}</p>')
+                parts.append(f'<p class="eli5-inline" style="font-size:.85em;margin:.2em 0">{_esc(eli5)}</p>')
             parts.append(f'<p class="finding-desc">{desc}</p>')
             if note:
                 parts.append(f'<p class="finding-note">Note: {note}</p>')
             freq = f.get("freq")
             if freq and isinstance(freq, dict):
-                freq_labels = {"EUR": "European", "AFR": "African",
-                               "EAS": "East Asian", "SAS": "South Asian", "AMR": "American"}
-                freq_parts = [f'{freq_labels.get(p, p)}: {v:.0%}'
+                freq_parts = [f'{_FREQ_LABELS.get(p, p)}: {v:.0%}'
                               for p, v in sorted(freq.items(), key=lambda x: -x[1])
                               if v > 0.001]
                 if freq_parts:
@@ -1729,22 +1859,23 @@ def build_clinical_detail(findings, epistasis_results, carrier_screen_data):
         parts.append("</details>")
 
     # Pathway analysis
-    from ..clinical_context import PATHWAYS
     parts.append("<h3>Pathway Analysis</h3>")
-    gene_map = {f["gene"]: f for f in findings}
+    gene_index = {f["gene"]: i for i, f in enumerate(findings)}
     for pathway_name, pathway_genes in PATHWAYS.items():
-        pathway_findings = [gene_map[g] for g in pathway_genes if g in gene_map]
-        if not pathway_findings:
+        # Pathways list 3-6 genes, so one ordered walk with dict probes beats
+        # any set intersection and keeps the genes in their listed order
+        pathway_idx = [gene_index[g] for g in pathway_genes if g in gene_index]
+        if not pathway_idx:
             continue
         parts.append(f'<details><summary><strong>{_esc(pathway_name)}</strong></summary><ul>')
-        for pf in pathway_findings:
-            mag = pf.get("magnitude", 0)
-            mag_class = "high" if mag >= 3 else "mod" if mag == 2 else "low" if mag == 1 else "info"
-            parts.append(
+        items = []
+        for i in pathway_idx:
+            _, mag_class, status = badges[i]
+            items.append(
                 f'<li><span class="mag-dot mag-{mag_class}"></span> '
-                f'<strong>{_esc(pf["gene"])}</strong>: '
-                f'{_esc(pf.get("status","").replace("_"," ").title())}</li>'
+                f'<strong>{_esc(findings[i]["gene"])}</strong>: {status}</li>'
             )
+        parts.append("\n".join(items))
         parts.append("</ul></details>")
 
     # Epistasis
@@ -1758,19 +1889,19 @@ def build_clinical_detail(findings, epistasis_results, carrier_screen_data):
         for interaction in epistasis_results:
             color = risk_colors.get(interaction["risk_level"], "var(--accent)")
             genes_involved = interaction.get("genes_involved", {})
-            genes = ", ".join(genes_involved.keys()) if genes_involved else _esc(interaction.get("name", ""))
+            genes = ", ".join(genes_involved.keys()) if genes_involved else interaction.get("name", "")
             parts.append(
                 f'<details open><summary>'
                 f'<span class="mag-badge" style="background:{color};color:#fff">'
-                f'{interaction["risk_level"].upper()}</span> '
-                f'<strong>{interaction["name"]}</strong></summary>'
+                f'{_esc(interaction["risk_level"].upper())}</span> '
+                f'<strong>{_esc(interaction["name"])}</strong></summary>'
             )
-            parts.append(f'<p><strong>Genes:</strong> {genes}</p>')
-            parts.append(f'<p><strong>Effect:</strong> {interaction["effect"]}</p>')
-            parts.append(f'<p><strong>Mechanism:</strong> {interaction["mechanism"]}</p>')
+            parts.append(f'<p><strong>Genes:</strong> {_esc(genes)}</p>')
+            parts.append(f'<p><strong>Effect:</strong> {_esc(interaction["effect"])}</p>')
+            parts.append(f'<p><strong>Mechanism:</strong> {_esc(interaction["mechanism"])}</p>')
             parts.append("<p><strong>Recommended Actions:</strong></p><ul>")
             for action in interaction["actions"]:
-                parts.append(f"<li>{action}</li>")
+                parts.append(f"<li>{_esc(action)}</li>")
             parts.append("</ul></details>")
 
     # Carrier screening
@@ -1785,12 +1916,12 @@ def build_clinical_detail(findings, epistasis_results, carrier_screen_data):
             f'<p>{carrier_screen_data["total_carriers"]} carrier finding(s) organized by disease system.</p>'
         )
         for system, carriers in sorted(carrier_screen_data.get("by_system", {}).items()):
-            parts.append(f'<h4>{system}</h4><ul>')
+            parts.append(f'<h4>{_esc(system)}</h4><ul>')
             for c in carriers:
-                note = f' &mdash; <em>{c["reproductive_note"]}</em>' if c.get("reproductive_note") else ""
+                note = f' &mdash; <em>{_esc(c["reproductive_note"])}</em>' if c.get("reproductive_note") else ""
                 parts.append(
-                    f'<li><strong>{c["gene"]}</strong> ({c.get("rsid", "")}): '
-                    f'{c["condition"]} <span class="badge">{c["inheritance"]}</span>{note}</li>'
+                    f'<li><strong>{_esc(c["gene"])}</strong> ({_esc(c.get("rsid", ""))}): '
+                    f'{_esc(c["condition"])} <span class="badge">{_esc(c["inheritance"])}</span>{note}</li>'
                 )
             parts.append("</ul>")
 
@@ -1798,7 +1929,7 @@ def build_clinical_detail(findings, epistasis_results, carrier_screen_data):
         if couples:
             parts.append('<h4>Couples-Relevant Conditions</h4><ul>')
             for c in couples:
-                parts.append(f'<li><strong>{c["gene"]}</strong>: {c["condition"]}</li>')
+                parts.append(f'<li><strong>{_esc(c["gene"])}</strong>: {_esc(c["condition"])}</li>')
             parts.append("</ul>")
 
     return "\n".join(parts)
@@ -1826,7 +1957,8 @@ def build_ancestry_section(ancestry_results, mt_haplogroup_data=None):
         parts.append('<div class="chart-grid">')
         parts.append("<div>")
         parts.append("<h3>Ancestry Proportions</h3>")
-        parts.append(svg_ancestry_donut(ancestry_results))
+        sorted_pops = sorted(ancestry_results.get("proportions", {}).items(), key=lambda kv: -kv[1])
+        parts.append(svg_ancestry_donut(ancestry_results, sorted_pops))
         parts.append("</div>")
 
         parts.append("<div>")
@@ -1834,12 +1966,8 @@ def build_ancestry_section(ancestry_results, mt_haplogroup_data=None):
         parts.append(f'<p><strong>Confidence:</strong> {ancestry_results["confidence"].title()} '
                      f'({ancestry_results["markers_found"]} markers)</p>')
         parts.append('<table><tr><th>Population</th><th>Proportion</th></tr>')
-        labels = {"EUR": "European", "AFR": "African", "EAS": "East Asian",
-                  "SAS": "South Asian", "AMR": "Admixed American"}
-        for pop in sorted(ancestry_results["proportions"],
-                          key=lambda p: -ancestry_results["proportions"][p]):
-            prop = ancestry_results["proportions"][pop]
-            label = labels.get(pop, pop)
+        for pop, prop in sorted_pops:
+            label = _ANCESTRY_LABELS.get(pop, pop)
             parts.append(f'<tr><td>{label} ({pop})</td><td>{prop:.1%}</td></tr>')
         parts.append("</table>")
         parts.append("</div>")
@@ -1937,8 +2065,7 @@ def build_nutrigenomics_section(nutrigenomics_data, recommendations_data, insigh
 
     # Nutrition narratives from insights
     narratives = (insights_data or {}).get("narratives", [])
-    nutrition_narrative_ids = {"methylation_choline", "vitamin_d_profile", "iron_profile", "caffeine_metabolism"}
-    nutrition_narratives = [n for n in narratives if n.get("id", "") in nutrition_narrative_ids]
+    nutrition_narratives = [n for n in narratives if n.get("id", "") in _NUTRITION_NARRATIVE_IDS]
     if nutrition_narratives:
         parts.append("<h3>Nutritional Gene Stories</h3>")
         for n in nutrition_narratives:
@@ -2071,8 +2198,8 @@ def build_doctor_card(recommendations_data, star_alleles_data, apoe_data, acmg_d
             note = p.get("doctor_note", "") or p.get("why", "")
             note = _clean_why(note)
             parts.append(
-                f'<tr><td><strong>{p["title"]}</strong></td>'
-                f'<td>{note}</td></tr>'
+                f'<tr><td><strong>{_esc(p["title"])}</strong></td>'
+                f'<td>{_esc(note)}</td></tr>'
             )
         parts.append("</table>")
 
@@ -2083,21 +2210,20 @@ def build_doctor_card(recommendations_data, star_alleles_data, apoe_data, acmg_d
         for ref in referrals:
             color = urgency_colors.get(ref.get("urgency", ""), "var(--border)")
             parts.append(
-                f'<p><strong>{ref["specialist"]}</strong>: {_clean_why(ref["reason"])} '
+                f'<p><strong>{_esc(ref["specialist"])}</strong>: {_esc(_clean_why(ref["reason"]))} '
                 f'<span class="mag-badge" style="background:{color};color:#fff">'
-                f'{ref.get("urgency", "routine")}</span></p>'
+                f'{_esc(ref.get("urgency", "routine"))}</span></p>'
             )
 
     if star_alleles_data:
         parts.append("<h4>Pharmacogenomic Profile</h4>")
         parts.append('<table><tr><th>Gene</th><th>Diplotype</th><th>Phenotype</th></tr>')
-        for gene, r in star_alleles_data.items():
-            phenotype = r["phenotype"].replace("_", " ").title()
-            parts.append(
-                f'<tr><td><strong>{gene}</strong></td>'
-                f'<td><code>{r["diplotype"]}</code></td>'
-                f'<td>{phenotype}</td></tr>'
-            )
+        parts.append("\n".join(
+            f'<tr><td><strong>{_esc(gene)}</strong></td>'
+            f'<td><code>{_esc(r["diplotype"])}</code></td>'
+            f'<td>{_esc(_humanize(r["phenotype"]))}</td></tr>'
+            for gene, r in star_alleles_data.items()
+        ))
         parts.append("</table>")
 
     if apoe_data and apoe_data.get("apoe_type") != "Unknown":
@@ -2108,7 +2234,7 @@ def build_doctor_card(recommendations_data, star_alleles_data, apoe_data, acmg_d
         color = risk_colors.get(apoe_data.get("risk_level", ""), "var(--accent2)")
         parts.append(
             f'<h4>APOE Status</h4>'
-            f'<p><strong>{apoe_data["apoe_type"]}</strong> — '
+            f'<p><strong>{_esc(apoe_data["apoe_type"])}</strong> — '
             f'<span class="mag-badge" style="background:{color};color:#fff">'
             f'{apoe_data["risk_level"].title()} Risk</span></p>'
         )
@@ -2117,15 +2243,12 @@ def build_doctor_card(recommendations_data, star_alleles_data, apoe_data, acmg_d
     if acmg_findings:
         parts.append("<h4>ACMG Medically Actionable Findings</h4>")
         parts.append('<table><tr><th>Gene</th><th>Condition</th><th>Actionability</th></tr>')
-        for f in acmg_findings:
-            gene = f.get("gene", "Unknown")
-            condition = _clean_condition(f.get("traits") or "Unknown")
-            action = f.get("acmg_actionability", "")
-            parts.append(
-                f'<tr><td><strong>{gene}</strong></td>'
-                f'<td>{condition}</td>'
-                f'<td>{action}</td></tr>'
-            )
+        parts.append("\n".join(
+            f'<tr><td><strong>{_esc(f.get("gene", "Unknown"))}</strong></td>'
+            f'<td>{_esc(_clean_condition(f.get("traits") or "Unknown"))}</td>'
+            f'<td>{_esc(f.get("acmg_actionability", ""))}</td></tr>'
+            for f in acmg_findings
+        ))
         parts.append("</table>")
         parts.append(
             '<div class="doctor-callout" style="border-color:var(--warn)">'
@@ -2136,10 +2259,10 @@ def build_doctor_card(recommendations_data, star_alleles_data, apoe_data, acmg_d
     if schedule:
         parts.append("<h4>Recommended Monitoring</h4>")
         parts.append('<table><tr><th>Test</th><th>Frequency</th></tr>')
-        for m in schedule:
-            parts.append(
-                f'<tr><td>{m["test"]}</td><td>{m["frequency"]}</td></tr>'
-            )
+        parts.append("\n".join(
+            f'<tr><td>{_esc(m["test"])}</td><td>{_esc(m["frequency"])}</td></tr>'
+            for m in schedule
+        ))
         parts.append("</table>")
 
     parts.append("</div>")
@@ -2154,51 +2277,43 @@ def build_doctor_card(recommendations_data, star_alleles_data, apoe_data, acmg_d
 # SECTION 12: REFERENCES & DATABASE LINKS
 # =============================================================================
 
+_METHODOLOGY_HTML = (
+    "<h3>Methodology &amp; Disclaimers</h3>\n"
+    "<ul>"
+    "<li>Lifestyle findings from curated SNP database (~260 variants)</li>"
+    "<li>Disease risk from ClinVar (~341K variants scanned)</li>"
+    "<li>Drug interactions from PharmGKB clinical annotations</li>"
+    "<li>Polygenic risk scores from published GWAS (8 conditions)</li>"
+    "<li>Star allele calling for 6 pharmacogenes (CPIC-style)</li>"
+    "<li>Only true SNPs analyzed (indels filtered to prevent false positives)</li>"
+    "<li>This report is for <strong>informational purposes only</strong> — not a clinical diagnosis</li>"
+    "<li>Genetic associations are probabilistic, not deterministic</li>"
+    "<li>Always consult healthcare providers before making medical decisions</li>"
+    "</ul>"
+)
+
+
 def build_references(findings):
     """All rsID links, paper citations, methodology."""
     parts = []
 
     # Curated papers
     parts.append("<h3>Key Papers</h3><ul>")
-    seen = set()
-    for rsid, refs in PAPER_REFS.items():
-        for r in refs:
-            key = r["pmid"]
-            if key in seen:
-                continue
-            seen.add(key)
-            parts.append(
-                f'<li><a href="https://pubmed.ncbi.nlm.nih.gov/{r["pmid"]}/" '
-                f'target="_blank" rel="noopener">{r["title"]}</a> '
-                f'(PMID: {r["pmid"]}, {r["year"]})</li>'
-            )
+    parts.append(_KEY_PAPERS_HTML)
     parts.append("</ul>")
 
     # All rsID links
-    rsids = sorted(set(f.get("rsid", "") for f in findings if f.get("rsid", "").startswith("rs")))
+    rsids = sorted({rsid for rsid in (f.get("rsid", "") for f in findings) if rsid.startswith("rs")})
     if rsids:
         parts.append("<h3>Database Links for All Analyzed rsIDs</h3>")
         parts.append('<div class="rsid-grid">')
-        for rsid in rsids:
-            ref_html = paper_refs_html(rsid)
-            parts.append(f"<div><code>{rsid}</code> {db_links_html(rsid)}{ref_html}</div>")
+        parts.append("\n".join(
+            f"<div><code>{_esc(rsid)}</code> {db_links_html(rsid)}{paper_refs_html(rsid)}</div>"
+            for rsid in rsids
+        ))
         parts.append("</div>")
 
-    # Methodology
-    parts.append("<h3>Methodology &amp; Disclaimers</h3>")
-    parts.append(
-        "<ul>"
-        "<li>Lifestyle findings from curated SNP database (~260 variants)</li>"
-        "<li>Disease risk from ClinVar (~341K variants scanned)</li>"
-        "<li>Drug interactions from PharmGKB clinical annotations</li>"
-        "<li>Polygenic risk scores from published GWAS (8 conditions)</li>"
-        "<li>Star allele calling for 6 pharmacogenes (CPIC-style)</li>"
-        "<li>Only true SNPs analyzed (indels filtered to prevent false positives)</li>"
-        "<li>This report is for <strong>informational purposes only</strong> — not a clinical diagnosis</li>"
-        "<li>Genetic associations are probabilistic, not deterministic</li>"
-        "<li>Always consult healthcare providers before making medical decisions</li>"
-        "</ul>"
-    )
+    parts.append(_METHODOLOGY_HTML)
 
     return "\n".join(parts)
 
@@ -2251,59 +2366,14 @@ def build_disease_risk(disease_findings):
         'Variants identified by scanning your genome against the ClinVar database.</p>'
     )
 
-    def _variant_table(variants, label, color):
-        if not variants:
-            return ""
-        rows = []
-        rows.append(
-            f'<h3>{label} '
-            f'<span class="badge" style="background:{color}">{len(variants)}</span></h3>'
-        )
-        rows.append(
-            '<table><tr><th>Gene</th><th>Condition</th><th>Genotype</th>'
-            '<th>Stars</th><th>Zygosity</th></tr>'
-        )
-        for v in variants[:50]:
-            gene = _esc(v.get("gene", "Unknown"))
-            condition = _esc(_clean_condition(v.get("traits") or "Unknown"))
-            genotype = _esc(v.get("user_genotype", ""))
-            stars = v.get("gold_stars", 0)
-            star_str = "&#9733;" * stars + "&#9734;" * (4 - stars)
-            zyg = _esc(v.get("zygosity", "").replace("_", " ").title())
-            rows.append(
-                f'<tr><td><strong>{gene}</strong></td>'
-                f'<td style="max-width:400px;overflow:hidden;text-overflow:ellipsis;white-space:nowrap" title="{_esc(v.get("traits", ""))}">{condition}</td>'
-                f'<td><code>{genotype}</code></td>'
-                f'<td>{star_str}</td>'
-                f'<td>{zyg}</td></tr>'
-            )
-        rows.append("</table>")
-        return "\n".join(rows)
-
-    parts.append(_variant_table(
-        disease_findings.get("pathogenic", []), "Pathogenic Variants", C["red"]))
-    parts.append(_variant_table(
-        disease_findings.get("likely_pathogenic", []), "Likely Pathogenic Variants", C["orange"]))
-    parts.append(_variant_table(
-        disease_findings.get("risk_factor", []), "Risk Factor Variants", C["amber"]))
-    parts.append(_variant_table(
-        disease_findings.get("drug_response", []), "Drug Response Variants", C["blue"]))
+    parts.extend(
+        _clinvar_table(disease_findings.get(key, []), label, C[color], show_overflow=False)
+        for key, label, color in _CLINVAR_TIERS
+    )
 
     protective = disease_findings.get("protective", [])
     if protective:
-        parts.append(
-            f'<h3>Protective Variants '
-            f'<span class="badge" style="background:var(--green)">{len(protective)}</span></h3>'
-        )
-        parts.append('<div class="good-news-grid">')
-        for v in protective:
-            gene = _esc(v.get("gene", "Unknown"))
-            condition = _esc(_clean_condition(v.get("traits") or ""))
-            parts.append(
-                f'<div class="good-news-card">'
-                f'<strong>{gene}</strong>: {condition}</div>'
-            )
-        parts.append("</div>")
+        parts.append(_protective_grid(protective))
 
     return "\n".join(parts)
 
@@ -2323,10 +2393,10 @@ def build_monitoring(recommendations_data):
         freq = m.get("frequency", "").lower()
         color = next((c for key, c in freq_colors.items() if key in freq), "var(--accent2)")
         parts.append(
-            f'<tr><td><strong>{m["test"]}</strong></td>'
+            f'<tr><td><strong>{_esc(m["test"])}</strong></td>'
             f'<td><span class="mag-badge" style="background:{color};color:#fff">'
-            f'{m["frequency"]}</span></td>'
-            f'<td>{m["reason"]}</td></tr>'
+            f'{_esc(m["frequency"])}</span></td>'
+            f'<td>{_esc(m["reason"])}</td></tr>'
         )
     parts.append("</table>")
     parts.append(
@@ -2341,14 +2411,10 @@ def build_nutrition_section(recommendations_data, insights_data):
     if not recommendations_data and not insights_data:
         return "<p>No nutrition data available.</p>"
     parts = []
-    nutrition_groups = {"methylation", "iron_metabolism", "caffeine", "metabolic_diabetes",
-                        "nutrition", "vitamin_d", "iron"}
-    nutrition_narrative_ids = {"methylation_choline", "vitamin_d_profile", "iron_profile",
-                               "caffeine_metabolism"}
     priorities = (recommendations_data or {}).get("priorities", [])
     nutrition_priorities = [
         p for p in priorities
-        if any(g in p.get("id", "").lower() for g in nutrition_groups)
+        if any(g in p.get("id", "").lower() for g in _NUTRITION_GROUPS)
     ]
     if nutrition_priorities:
         parts.append(
@@ -2377,7 +2443,7 @@ def build_nutrition_section(recommendations_data, insights_data):
                 parts.append("</ul>")
             parts.append("</details>")
     narratives = (insights_data or {}).get("narratives", [])
-    nutrition_narratives = [n for n in narratives if n.get("id", "") in nutrition_narrative_ids]
+    nutrition_narratives = [n for n in narratives if n.get("id", "") in _NUTRITION_NARRATIVE_IDS]
     if nutrition_narratives:
         parts.append("<h3>Nutritional Gene Stories</h3>")
         for n in nutrition_narratives:
@@ -2414,18 +2480,18 @@ def build_protective(recommendations_data, insights_data):
             desc = _clean_condition(g["description"]) if "|" in g.get("description", "") else g["description"]
             parts.append(
                 f'<div class="good-news-card">'
-                f'<strong>{g["gene"]}</strong>: {desc}</div>'
+                f'<strong>{_esc(g["gene"])}</strong>: {_esc(desc)}</div>'
             )
         parts.append("</div>")
     if protective:
         parts.append("<h3>Research-Backed Protective Findings</h3>")
         for p in protective:
-            status = p["status"].replace("_", " ").title()
+            status = _humanize(p["status"])
             parts.append(
                 f'<details class="rec-card" style="border-left:4px solid var(--green)">'
-                f'<summary><strong>{p["gene"]}</strong> ({status}): {p["title"]}</summary>'
-                f'<p>{p["finding"]}</p>'
-                f'<div class="paper-refs">Ref: {p["reference"]}</div>'
+                f'<summary><strong>{_esc(p["gene"])}</strong> ({_esc(status)}): {_esc(p["title"])}</summary>'
+                f'<p>{_esc(p["finding"])}</p>'
+                f'<div class="paper-refs">Ref: {_esc(p["reference"])}</div>'
                 f'</details>'
             )
     return "\n".join(parts)
@@ -2504,6 +2570,7 @@ table {{
 }}
 th, td {{ border: 1px solid var(--border); padding: .5em .7em; text-align: left; }}
 th {{ background: var(--code-bg); font-weight: 600; font-family: var(--heading-font); font-size: .9em; }}
+td.desc-trunc {{ max-width: 400px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }}
 tr:nth-child(even) {{ background: var(--table-stripe); }}
 ul, ol {{ padding-left: 1.3em; }}
 li {{ margin: .35em 0; }}
@@ -2531,7 +2598,13 @@ p {{ margin: .6em 0; }}
   background: var(--card-bg); border: 1px solid var(--border);
   border-radius: 6px; padding: 1.8em 1.6em; margin: 1.8em 0;
   box-shadow: var(--shadow);
+  /* Defer layout and paint of offscreen sections until scrolled into view */
+  content-visibility: auto; contain-intrinsic-size: auto 800px;
 }}
+/* The doctor card is meant to be printed or shown as-is, so it always renders */
+.doctor-card {{ content-visibility: visible; }}
+/* content-visibility clips overflow at the section edge, so wide tables scroll */
+.table-scroll {{ overflow-x: auto; }}
 .section:first-of-type {{
   border-top: 3px solid var(--accent);
 }}
@@ -2644,7 +2717,9 @@ details[open] > summary::before {{ transform: rotate(90deg); }}
   body {{ max-width: 100%; font-size: 10pt; padding: 0.5em; }}
   .chart, .gauge, .chart-grid, .gauge-row, .toc,
   .no-print {{ display: none !important; }}
-  .section {{ break-inside: avoid; box-shadow: none; border: 1px solid #ccc; }}
+  .section {{ break-inside: avoid; box-shadow: none; border: 1px solid #ccc;
+    content-visibility: visible; }}
+  .table-scroll {{ overflow: visible; }}
   .doctor-card {{ page-break-before: always; }}
   details {{ display: block; }}
   details > summary {{ display: none; }}
@@ -2841,24 +2916,37 @@ document.querySelectorAll('.toc a').forEach(function(a) {{
 (function() {{
   var searchBox = document.getElementById('search-box');
   if (!searchBox) return;
-  searchBox.addEventListener('input', function() {{
-    var q = this.value.toLowerCase().trim();
+  // Lowercased text is collected once, on the first search; the report is static
+  var index = null, frame = 0;
+  function buildIndex() {{
+    index = [];
     document.querySelectorAll('.finding-card').forEach(function(card) {{
-      card.style.display = (!q || card.textContent.toLowerCase().indexOf(q) !== -1)
-        ? '' : 'none';
+      index.push({{ el: card, text: card.textContent.toLowerCase() }});
     }});
     document.querySelectorAll('table').forEach(function(table) {{
       var rows = table.querySelectorAll('tr');
       for (var i = 1; i < rows.length; i++) {{
-        rows[i].style.display = (!q || rows[i].textContent.toLowerCase().indexOf(q) !== -1)
-          ? '' : 'none';
+        index.push({{ el: rows[i], text: rows[i].textContent.toLowerCase() }});
       }}
     }});
+  }}
+  function filter() {{
+    var q = searchBox.value.toLowerCase().trim();
+    if (!index) buildIndex();
+    for (var i = 0; i < index.length; i++) {{
+      var display = (!q || index[i].text.indexOf(q) !== -1) ? '' : 'none';
+      if (index[i].el.style.display !== display) index[i].el.style.display = display;
+    }}
+  }}
+  searchBox.addEventListener('input', function() {{
+    cancelAnimationFrame(frame);
+    frame = requestAnimationFrame(filter);
   }});
 }})();
 
 // --- Sortable Tables ---
 (function() {{
+  var NON_NUMERIC = /[^0-9.\\-]/g;
   document.querySelectorAll('table').forEach(function(table) {{
     var headers = table.querySelectorAll('th');
     if (headers.length < 2) return;
@@ -2868,19 +2956,21 @@ document.querySelectorAll('.toc a').forEach(function(a) {{
         var isAsc = th.classList.contains('asc');
         headers.forEach(function(h) {{ h.classList.remove('asc', 'desc'); }});
         th.classList.add(isAsc ? 'desc' : 'asc');
-        var rows = Array.from(table.querySelectorAll('tr')).slice(1);
-        rows.sort(function(a, b) {{
-          var aText = (a.children[colIdx] || {{}}).textContent || '';
-          var bText = (b.children[colIdx] || {{}}).textContent || '';
-          var aNum = parseFloat(aText.replace(/[^0-9.\\-]/g, ''));
-          var bNum = parseFloat(bText.replace(/[^0-9.\\-]/g, ''));
-          if (!isNaN(aNum) && !isNaN(bNum)) {{
-            return isAsc ? bNum - aNum : aNum - bNum;
+        // Read and parse each cell once, not on every comparison
+        var keyed = Array.from(table.querySelectorAll('tr')).slice(1).map(function(r) {{
+          var text = (r.children[colIdx] || {{}}).textContent || '';
+          return {{ row: r, text: text, num: parseFloat(text.replace(NON_NUMERIC, '')) }};
+        }});
+        keyed.sort(function(a, b) {{
+          if (!isNaN(a.num) && !isNaN(b.num)) {{
+            return isAsc ? b.num - a.num : a.num - b.num;
           }}
-          return isAsc ? bText.localeCompare(aText) : aText.localeCompare(bText);
+          return isAsc ? b.text.localeCompare(a.text) : a.text.localeCompare(b.text);
         }});
         var tbody = table.querySelector('tbody') || table;
-        rows.forEach(function(r) {{ tbody.appendChild(r); }});
+        var frag = document.createDocumentFragment();
+        keyed.forEach(function(k) {{ frag.appendChild(k.row); }});
+        tbody.appendChild(frag);
       }});
     }});
   }});
@@ -2891,24 +2981,34 @@ document.querySelectorAll('.toc a').forEach(function(a) {{
   var input = document.getElementById('drug-checker');
   var results = document.getElementById('drug-checker-results');
   if (!input || !results) return;
+  // Drug cards and table rows are collected once, on the first query
+  var cards = null, rows = null;
+  function buildIndex() {{
+    cards = [];
+    document.querySelectorAll('#drug-guide .rec-card').forEach(function(card) {{
+      cards.push({{ html: card.outerHTML, text: card.textContent.toLowerCase() }});
+    }});
+    rows = [];
+    document.querySelectorAll('#drug-guide table').forEach(function(table) {{
+      var trs = table.querySelectorAll('tr');
+      for (var i = 1; i < trs.length; i++) {{
+        rows.push({{ raw: trs[i].textContent, text: trs[i].textContent.toLowerCase() }});
+      }}
+    }});
+  }}
   input.addEventListener('input', function() {{
     var q = this.value.toLowerCase().trim();
     if (!q || q.length < 2) {{ results.innerHTML = ''; return; }}
+    if (!cards) buildIndex();
     var found = [];
     // Search in drug dosing cards
-    document.querySelectorAll('#drug-guide .rec-card').forEach(function(card) {{
-      if (card.textContent.toLowerCase().indexOf(q) !== -1) {{
-        found.push(card.outerHTML);
-      }}
+    cards.forEach(function(c) {{
+      if (c.text.indexOf(q) !== -1) found.push(c.html);
     }});
     // Search in PharmGKB table
-    var tables = document.querySelectorAll('#drug-guide table');
-    tables.forEach(function(table) {{
-      var rows = table.querySelectorAll('tr');
-      for (var i = 1; i < rows.length; i++) {{
-        if (rows[i].textContent.toLowerCase().indexOf(q) !== -1) {{
-          found.push('<div class="finding-card" style="font-size:.9em">' + rows[i].textContent + '</div>');
-        }}
+    rows.forEach(function(r) {{
+      if (r.text.indexOf(q) !== -1) {{
+        found.push('<div class="finding-card" style="font-size:.9em">' + r.raw + '</div>');
       }}
     }});
     if (found.length > 0) {{
@@ -2923,29 +3023,14 @@ document.querySelectorAll('.toc a').forEach(function(a) {{
 (function() {{
   var btn = document.getElementById('export-csv');
   if (!btn) return;
+  function csvField(v) {{
+    return /[",\\n]/.test(v) ? '"' + v.replace(/"/g, '""') + '"' : v;
+  }}
   btn.addEventListener('click', function() {{
     var lines = ['Gene,rsID,Genotype,Status,Category,Magnitude'];
-    document.querySelectorAll('.finding-card').forEach(function(card) {{
-      var header = card.querySelector('.finding-header');
-      if (!header) return;
-      var text = header.textContent;
-      var parts = text.split(/\\s+—\\s+/);
-      var gene = '', rsid = '', genotype = '', status = '';
-      if (parts.length >= 1) {{
-        var m = parts[0].match(/([A-Z0-9]+)\\s+(rs\\d+)\\s+(.+)/);
-        if (m) {{ gene = m[1]; rsid = m[2]; genotype = m[3]; }}
-      }}
-      if (parts.length >= 2) status = parts[parts.length - 1].trim();
-      var mag = '';
-      var magEl = card.querySelector('.mag-badge');
-      if (magEl) mag = magEl.textContent.trim();
-      var cat = '';
-      var section = card.closest('.category-section');
-      if (section) {{
-        var sum = section.querySelector('summary');
-        if (sum) cat = sum.textContent.replace(/\\d+$/, '').trim();
-      }}
-      lines.push([gene, rsid, genotype, status, cat, mag].join(','));
+    document.querySelectorAll('.finding-card[data-rsid]').forEach(function(card) {{
+      var d = card.dataset;
+      lines.push([d.gene, d.rsid, d.genotype, d.status, d.category, d.mag].map(csvField).join(','));
     }});
     var csv = lines.join('\\n');
     if (navigator.clipboard) {{
@@ -2962,6 +3047,63 @@ document.querySelectorAll('.toc a').forEach(function(a) {{
 """
 
 
+def _compile_template(template):
+    """Split a str.format template into literal chunks and (field, spec) pairs.
+
+    Brace unescaping and field parsing happen once, at import time.
+    """
+    literals, fields, pending = [], [], []
+    for literal, field, spec, _ in Formatter().parse(template):
+        pending.append(literal)
+        if field is not None:
+            literals.append("".join(pending))
+            pending = []
+            fields.append((field, spec))
+    literals.append("".join(pending))
+    return tuple(literals), tuple(fields)
+
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r" ?([{};,>]) ?")
+
+
+def _minify_css(css):
+    """Drop comments and redundant whitespace from a CSS block."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    return css.replace(": ", ":").strip()
+
+
+def _minify_style_block(chunk):
+    """Minify the contents of a <style> element if the chunk contains one."""
+    head, sep, rest = chunk.partition("<style>")
+    css, end, tail = rest.partition("</style>")
+    if not (sep and end):
+        return chunk
+    return head + sep + "\n" + _minify_css(css) + "\n" + end + tail
+
+
+_TEMPLATE_LITERALS, _TEMPLATE_FIELDS = _compile_template(HTML_TEMPLATE)
+# The stylesheet is constant, so it is minified once here rather than shipped
+# with its source formatting in every report
+_TEMPLATE_LITERALS = tuple(_minify_style_block(chunk) for chunk in _TEMPLATE_LITERALS)
+
+
+def _iter_template(values):
+    """Yield the pieces of HTML_TEMPLATE.format(**values) in document order."""
+    yield _TEMPLATE_LITERALS[0]
+    for (field, spec), literal in zip(_TEMPLATE_FIELDS, _TEMPLATE_LITERALS[1:]):
+        yield format(values[field], spec)
+        yield literal
+
+
+def _render_template(values):
+    """Equivalent to HTML_TEMPLATE.format(**values), using the precompiled chunks."""
+    return "".join(_iter_template(values))
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -3081,9 +3223,11 @@ def main():
             'For comprehensive results, use a 30x whole genome sequencing dataset or 23andMe raw data.</div>'
         )
 
-    html = HTML_TEMPLATE.format(
-        generated_date=datetime.now().strftime("%Y-%m-%d %H:%M"),
-        total_snps=summary.get("total_snps", 0),
+    # Header and footer both show the date; stamp it once
+    generated_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+    values = dict(
+        generated_date=generated_date,
+        total_snps=total_snps,
         num_findings=len(findings),
         num_pharmgkb=len(pharmgkb_findings),
         subject_title=subject_title,
@@ -3102,12 +3246,25 @@ def main():
         references_content=references,
     )
 
+    # Stream the pieces straight to disk rather than joining the whole
+    # document (and its encoded copy) in memory first
     output_path = REPORTS_DIR / "GENETIC_HEALTH_REPORT.html"
-    output_path.write_text(html, encoding="utf-8")
+    # Stream into a sibling temp file so a failed render never truncates
+    # the previous report
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    size = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            for piece in _iter_template(values):
+                size += f.write(piece)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, output_path)
 
     print(f"\n{'='*60}")
     print(f"Report generated: {output_path}")
-    print(f"Size: {len(html):,} characters")
+    print(f"Size: {size:,} characters")
     print(f"{'='*60}")
 
 
@@ -37,6 +37,12 @@ REF_GENOME = REF_DIR / "human_g1k_v37.fasta"
 REF_MMI = REF_DIR / "human_g1k_v37.mmi"
 RSID_LOOKUP = DATA_DIR / "rsid_positions_grch37.json"
 
+# bcftools stats "SN" keys worth logging -> log label
+_BCFTOOLS_SN_LABELS = {
+    "number of records:": "Variants called",
+    "number of SNPs:": "SNPs",
+}
+
 
 def log(msg):
     print(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}", flush=True)
@@ -125,7 +131,7 @@ def step_align(fastq_in, threads):
     run(f"samtools index -@ {threads} {bam}", "  Indexing BAM")
 
     result = run(f"samtools flagstat {bam}")
-    for line in result.stdout.strip().split('\n')[:5]:
+    for line in result.stdout.strip().splitlines()[:5]:
         log(f"  {line.strip()}")
 
     return bam
@@ -157,8 +163,7 @@ def _build_target_regions():
 
     # Collect SNP database positions from rsID lookup
     if RSID_LOOKUP.exists():
-        with open(RSID_LOOKUP) as f:
-            lookup = json.load(f)
+        lookup = json.loads(RSID_LOOKUP.read_bytes())
         for info in lookup.values():
             chrom = info.get('chrom', '')
             pos = info.get('pos', '')
@@ -206,11 +211,13 @@ def step_call(bam_in, threads, targeted=True):
     run(f"bcftools index {vcf}")
 
     result = run(f"bcftools stats {vcf}")
-    for line in result.stdout.split('\n'):
-        if line.startswith('SN') and 'number of records' in line:
-            log(f"  Variants called: {line.strip().split(chr(9))[-1]}")
-        if line.startswith('SN') and 'number of SNPs' in line:
-            log(f"  SNPs: {line.strip().split(chr(9))[-1]}")
+    for line in result.stdout.splitlines():
+        if not line.startswith('SN'):
+            continue
+        fields = line.strip().split('\t')
+        label = _BCFTOOLS_SN_LABELS.get(fields[2]) if len(fields) > 3 else None
+        if label:
+            log(f"  {label}: {fields[-1]}")
 
     return vcf
 
@@ -304,8 +311,7 @@ def step_rsid_lookup():
     # Load existing lookup and find missing rsIDs
     lookup = {}
     if RSID_LOOKUP.exists():
-        with open(RSID_LOOKUP) as f:
-            lookup = json.load(f)
+        lookup = json.loads(RSID_LOOKUP.read_bytes())
 
     missing = [r for r in all_rsids if r not in lookup]
     if not missing:
@@ -372,8 +378,7 @@ def step_convert(vcf_in, genome_out):
     # Load rsID position lookup (position -> rsid)
     pos_to_rsid = {}
     if RSID_LOOKUP.exists():
-        with open(RSID_LOOKUP) as f:
-            lookup = json.load(f)
+        lookup = json.loads(RSID_LOOKUP.read_bytes())
         for rsid, info in lookup.items():
             pos_to_rsid[f"{info['chrom']}:{info['pos']}"] = rsid
 
@@ -223,7 +223,7 @@ def extract_from_bam(bam_path, ref_genome, missing_positions):
         pos_to_rsid[f"{chrom}:{pos}"] = rsid
 
     entries = {}
-    for line in result.stdout.split('\n'):
+    for line in result.stdout.splitlines():
         if line.startswith('#') or not line.strip():
             continue
 
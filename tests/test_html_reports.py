@@ -1,7 +1,11 @@
 """Tests for enhanced HTML report builders."""
 
+import pytest
+
+from genetic_health.reports import enhanced_html
 from genetic_health.reports.enhanced_html import (
     build_ancestry_section,
+    build_clinical_detail,
     build_prs_section,
     build_epistasis_section,
     build_disease_risk,
@@ -11,9 +15,100 @@ from genetic_health.reports.enhanced_html import (
     build_protective,
     svg_ancestry_donut,
     svg_prs_gauge,
+    _clean_condition,
+    _humanize,
+    _minify_style_block,
+    _render_template,
+    _TEMPLATE_FIELDS,
+    HTML_TEMPLATE,
+    db_links_html,
 )
 
 
+class TestDbLinks:
+    def test_links_all_databases(self):
+        out = db_links_html("rs429358")
+        for name in ("dbSNP", "ClinVar", "SNPedia", "PharmGKB"):
+            assert name in out
+        assert "https://www.ncbi.nlm.nih.gov/snp/rs429358" in out
+
+    def test_non_rsid_returns_empty(self):
+        assert db_links_html("") == ""
+        assert db_links_html("chr1_12345") == ""
+
+    def test_repeat_calls_are_cached(self):
+        db_links_html.cache_clear()
+        first = db_links_html("rs1801133")
+        assert db_links_html("rs1801133") is first
+        assert db_links_html.cache_info().hits == 1
+
+
+class TestRenderTemplate:
+    def test_matches_str_format(self):
+        values = {field: f"<{field}>" for field, _ in _TEMPLATE_FIELDS}
+        values["total_snps"] = 612345
+        assert _render_template(values) == _minify_style_block(HTML_TEMPLATE.format(**values))
+
+    def test_stylesheet_is_minified(self):
+        values = {field: "" for field, _ in _TEMPLATE_FIELDS}
+        values["total_snps"] = 0
+        html = _render_template(values)
+        css = html[html.index("<style>"):html.index("</style>")]
+        assert "/*" not in css
+        assert "  " not in css
+        assert ":root{--bg:#faf9f6;" in css
+
+
+class TestMainWrite:
+    def test_failed_render_keeps_previous_report(self, tmp_path, monkeypatch):
+        (tmp_path / "comprehensive_results.json").write_text("{}")
+        report = tmp_path / "GENETIC_HEALTH_REPORT.html"
+        report.write_text("previous report")
+        monkeypatch.setattr(enhanced_html, "REPORTS_DIR", tmp_path)
+
+        def broken(values):
+            yield "<!DOCTYPE html>"
+            raise ValueError("bad field")
+
+        monkeypatch.setattr(enhanced_html, "_iter_template", broken)
+        with pytest.raises(ValueError):
+            enhanced_html.main()
+        assert report.read_text() == "previous report"
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "GENETIC_HEALTH_REPORT.html", "comprehensive_results.json"]
+
+    def test_writes_report(self, tmp_path, monkeypatch):
+        (tmp_path / "comprehensive_results.json").write_text("{}")
+        monkeypatch.setattr(enhanced_html, "REPORTS_DIR", tmp_path)
+        enhanced_html.main()
+        assert (tmp_path / "GENETIC_HEALTH_REPORT.html").read_text().startswith("<!DOCTYPE html>")
+        assert not (tmp_path / "GENETIC_HEALTH_REPORT.html.tmp").exists()
+
+
+class TestCleanCondition:
+    def test_single_name_passes_through(self):
+        assert _clean_condition(" Lynch syndrome ") == "Lynch syndrome"
+
+    def test_single_all_caps_name_is_title_cased(self):
+        assert _clean_condition("LYNCH SYNDROME") == "Lynch Syndrome"
+
+    def test_pipe_separated_picks_informative_segment(self):
+        raw = "PI S|Alpha-1-antitrypsin deficiency|not provided"
+        assert _clean_condition(raw) == "Alpha-1-antitrypsin deficiency"
+
+    def test_only_generic_segments_falls_back_to_first(self):
+        assert _clean_condition("not provided|not specified") == "not provided"
+
+    def test_empty_is_unknown(self):
+        assert _clean_condition("") == "Unknown"
+
+
+class TestHumanize:
+    def test_snake_case_to_title(self):
+        assert _humanize("poor_metabolizer") == "Poor Metabolizer"
+        assert _humanize("") == ""
+
+
 class TestAncestrySection:
     MOCK_ANCESTRY = {
         "proportions": {"EUR": 0.82, "AFR": 0.05, "EAS": 0.03, "SAS": 0.07, "AMR": 0.03},
@@ -119,6 +214,27 @@ class TestPRSSection:
         html = build_prs_section(prs)
         assert "non-European" in html
 
+    def test_escapes_html_in_names_and_rsids(self):
+        prs = {
+            "t": {
+                "name": "Heart <Disease> & Stroke", "raw_score": 2.0, "z_score": 2.0,
+                "percentile": 97.0, "risk_category": "high",
+                "snps_found": 1, "snps_total": 1, "ancestry_applicable": True,
+                "ancestry_warning": "",
+                "contributing_snps": [
+                    {"rsid": "rs1<x>", "gene": "A&B", "risk_allele": "T",
+                     "copies": 1, "log_or": 0.1, "contribution": 0.1},
+                ],
+                "reference": "Smith & Jones 2020",
+            },
+        }
+        html = build_prs_section(prs)
+        assert "<Disease>" not in html
+        assert "Heart &lt;Disease&gt; &amp; Stroke" in html
+        assert "rs1&lt;x&gt;" in html
+        assert "A&amp;B" in html
+        assert "Smith &amp; Jones 2020" in html
+
 
 class TestSVGGenerators:
     def test_ancestry_donut_returns_svg(self):
@@ -216,6 +332,11 @@ class TestDiseaseRiskSection:
         assert "CYP2C19" in html
         assert "<table>" in html
 
+    def test_tables_wrapped_for_scrolling(self):
+        html = build_disease_risk(self.MOCK_DISEASE)
+        assert html.count('<div class="table-scroll"><table>') == 4
+        assert html.count("</table></div>") == 4
+
     def test_pathogenic_shown(self):
         html = build_disease_risk(self.MOCK_DISEASE)
         assert "Pathogenic Variants" in html
@@ -241,6 +362,13 @@ class TestDiseaseRiskSection:
         html = build_disease_risk(data)
         assert "ClinVar" in html
 
+    def test_table_capped_at_50_rows(self):
+        variant = {"gene": "TTN", "traits": "Cardiomyopathy",
+                   "user_genotype": "AG", "gold_stars": 2, "zygosity": "heterozygous"}
+        html = build_disease_risk({"pathogenic": [variant] * 60})
+        assert html.count("<tr><td><strong>TTN</strong></td>") == 50
+        assert "Showing 50" not in html
+
 
 class TestMonitoringSection:
     MOCK_RECS = {
@@ -338,6 +466,17 @@ class TestDoctorCardSection:
         html = build_doctor_card(None, None, None, None)
         assert "No significant" in html
 
+    def test_escapes_html_in_fields(self):
+        star = {"CYP2D6": {"diplotype": "*1/<4>", "phenotype": "poor_metabolizer"}}
+        acmg = {"acmg_findings": [{"gene": "BRCA2", "traits": "Breast & ovarian cancer",
+                                   "acmg_actionability": "<i>screen</i>"}]}
+        recs = {"monitoring_schedule": [{"test": "Lipids <fasting>", "frequency": "annually"}]}
+        html = build_doctor_card(recs, star, {}, acmg)
+        assert "*1/&lt;4&gt;" in html
+        assert "Breast &amp; ovarian cancer" in html
+        assert "&lt;i&gt;screen&lt;/i&gt;" in html
+        assert "Lipids &lt;fasting&gt;" in html
+
 
 class TestNutritionSection:
     MOCK_RECS = {
@@ -433,3 +572,47 @@ class TestProtectiveSection:
     def test_protective_findings_only(self):
         html = build_protective({}, self.MOCK_INSIGHTS)
         assert "CHRNA5" in html
+
+    def test_escapes_html_in_fields(self):
+        recs = {"good_news": [{"gene": "<b>X</b>", "description": "a < b & c"}]}
+        html = build_protective(recs, {})
+        assert "<b>X</b>" not in html
+        assert "&lt;b&gt;X&lt;/b&gt;" in html
+        assert "a &lt; b &amp; c" in html
+
+
+class TestClinicalDetailSection:
+    MOCK_FINDINGS = [
+        {"gene": "MTHFR", "rsid": "rs1801133", "genotype": "AG", "category": "Methylation",
+         "status": "reduced", "description": "Reduced activity", "magnitude": 2},
+        {"gene": "COMT", "rsid": "rs4680", "genotype": "AA", "category": "Neurotransmitters",
+         "status": "slow", "description": "Slow COMT", "magnitude": 3},
+        {"gene": "MTRR", "rsid": "rs1801394", "genotype": "GG", "category": "Methylation",
+         "status": "reduced", "description": "Reduced MTRR", "magnitude": 1},
+    ]
+
+    def test_groups_by_category(self):
+        html = build_clinical_detail(self.MOCK_FINDINGS, [], {})
+        assert html.count('class="category-section"') == 2
+        assert html.index("Methylation") < html.index("Neurotransmitters")
+
+    def test_sorted_by_magnitude_within_category(self):
+        html = build_clinical_detail(self.MOCK_FINDINGS, [], {})
+        assert html.index("MTHFR") < html.index("MTRR")
+
+    def test_magnitude_classes(self):
+        html = build_clinical_detail(self.MOCK_FINDINGS, [], {})
+        assert 'finding-card high' in html
+        assert 'finding-card mod' in html
+        assert 'finding-card low' in html
+
+    def test_cards_carry_export_fields(self):
+        html = build_clinical_detail(self.MOCK_FINDINGS, [], {})
+        assert ('data-gene="COMT" data-rsid="rs4680" data-genotype="AA" '
+                'data-status="Slow" data-category="Neurotransmitters" data-mag="3"') in html
+
+    def test_escapes_eli5_text(self, monkeypatch):
+        monkeypatch.setitem(enhanced_html.ELI5_GENES, "COMT", "Dopamine <fast> & slow")
+        html = build_clinical_detail(self.MOCK_FINDINGS, [], {})
+        assert "Dopamine &lt;fast&gt; &amp; slow" in html
+        assert "<fast>" not in html